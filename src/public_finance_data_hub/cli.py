@@ -1,59 +1,225 @@
 """Command-line interface for Public Finance Data Hub."""
 
+import hashlib
+import importlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Final, Iterator, List, Optional, Tuple
 
+import msgspec
 import typer
+from dotenv import load_dotenv
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
 import yaml
 
+from public_finance_data_hub.config.schema import Source, SourcesConfig
 from public_finance_data_hub.utils.logging import setup_logging
-from public_finance_data_hub.storage.lake import DataLake
-from public_finance_data_hub.connectors.google_drive import GoogleDriveConnector
-from public_finance_data_hub.pipelines.ingest_bcb import ingest_bcb_series
-from public_finance_data_hub.pipelines.ingest_b3 import ingest_b3_cotahist
-from public_finance_data_hub.pipelines.ingest_cvm import ingest_cvm_dfp, ingest_cvm_itr
-from public_finance_data_hub.pipelines.ingest_fred import ingest_fred_series
-from public_finance_data_hub.pipelines.ingest_world_bank import ingest_world_bank_indicators
 
 app = typer.Typer(
     name="pfdh",
     help="Public Finance Data Hub - Catalog & sync financial data from multiple sources",
     no_args_is_help=True,
+    # Skip shell-completion setup and rich's traceback installer at startup
+    add_completion=False,
+    pretty_exceptions_enable=False,
 )
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 # Default paths
 DEFAULT_DATA_DIR = Path("./data")
 DEFAULT_LOG_DIR = Path("./logs")
 DEFAULT_CACHE_DIR = Path("./.cache")
+DEFAULT_CREDENTIALS_PATH = Path("./secrets/client_secret.json")
+DEFAULT_TOKEN_PATH = Path("./token.json")
+SYNC_MANIFEST_NAME = ".pfdh-sync-manifest.json"
+CONFIG_PATH: Final[Path] = Path(__file__).resolve().parent / "config" / "sources.yml"
+# Parsed-config sidecars live in the user cache dir, never in the installed package
+CONFIG_CACHE_DIR: Final[Path] = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "public-finance-data-hub"
+)
+
+# Ingestion pipelines per source as (module, function) pairs, run in order.
+# Modules are imported only when their source is ingested, so lightweight
+# commands don't pay for pandas/requests/Google client imports.
+PIPELINES_PACKAGE = "public_finance_data_hub.pipelines"
+SRC_PIPELINES: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "bcb": (("ingest_bcb", "ingest_bcb_series"),),
+    "b3": (("ingest_b3", "ingest_b3_cotahist"),),
+    "cvm": (("ingest_cvm", "ingest_cvm_dfp"), ("ingest_cvm", "ingest_cvm_itr")),
+    "fred": (("ingest_fred", "ingest_fred_series"),),
+    "world_bank": (("ingest_world_bank", "ingest_world_bank_indicators"),),
+}
+
+
+def _resolve_pipeline(module_name: str, func_name: str) -> Callable[..., Any]:
+    """Import a pipeline module on demand and return its entry point."""
+    module = importlib.import_module(f"{PIPELINES_PACKAGE}.{module_name}")
+    return getattr(module, func_name)
+
+
+_LOGGING_INITIALIZED = False
+
+
+def _init_logging(log_level: str) -> None:
+    """Configure package logging once per process."""
+    global _LOGGING_INITIALIZED
+    if _LOGGING_INITIALIZED:
+        return
+    setup_logging("public_finance_data_hub", level=log_level, log_dir=str(DEFAULT_LOG_DIR))
+    _LOGGING_INITIALIZED = True
+
+
+@app.callback()
+def main() -> None:
+    """Public Finance Data Hub - Catalog & sync financial data from multiple sources."""
+    # Once per invocation, not at import time; real env vars take precedence
+    load_dotenv(override=False)
 
 
 def get_config_path() -> Path:
     """Get path to sources.yml config."""
-    return Path(__file__).parent / "config" / "sources.yml"
+    return CONFIG_PATH
 
 
-def load_sources_config() -> dict:
-    """Load sources configuration."""
+def _load_cached_yaml(path: Path) -> dict:
+    """Load a YAML file through a MessagePack sidecar keyed by its content hash.
+
+    The sidecar lives in CONFIG_CACHE_DIR as ``<stem>.<md5>.msgpack``, so
+    editing the YAML automatically invalidates it. It holds plain data
+    (decoded with msgspec, never unpickled); failing to read or write it is
+    not an error.
+    """
+    raw = path.read_bytes()
+    digest = hashlib.md5(raw).hexdigest()
+    cache_path = CONFIG_CACHE_DIR / f"{path.stem}.{digest}.msgpack"
+
+    try:
+        return msgspec.msgpack.decode(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+
+    data = yaml.load(raw, Loader=YAMLLoader)
+
+    try:
+        CONFIG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for stale in CONFIG_CACHE_DIR.glob(f"{path.stem}.*.msgpack"):
+            stale.unlink(missing_ok=True)
+        cache_path.write_bytes(msgspec.msgpack.encode(data))
+    except (OSError, TypeError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
+    return data
+
+
+@lru_cache(maxsize=1)
+def load_sources_config() -> SourcesConfig:
+    """Load sources configuration.
+
+    Parsed and validated once per process; the result is a frozen struct so
+    the shared cached value cannot be mutated by callers. Use
+    ``load_sources_config.cache_clear()`` to force a reload.
+    """
     config_path = get_config_path()
     if not config_path.exists():
         console.print(f"[red]Error:[/red] Config not found at {config_path}")
         raise typer.Exit(1)
 
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return msgspec.convert(_load_cached_yaml(config_path), type=SourcesConfig)
+
+
+# Per-source fields shown by list-sources
+SUMMARY_FIELDS = frozenset({"type", "country", "description", "auth_required"})
+
+
+def _scalar_value(event: yaml.ScalarEvent) -> Any:
+    """Resolve a scalar event to its Python value (bools, ints, nulls, ...)."""
+    tag = event.tag or yaml.resolver.Resolver().resolve(
+        yaml.ScalarNode, event.value, event.implicit
+    )
+    node = yaml.ScalarNode(tag, event.value, style=event.style)
+    return yaml.constructor.SafeConstructor().construct_object(node)
+
+
+def _skip_node(events: Iterator[yaml.Event], first: yaml.Event) -> None:
+    """Consume the rest of a node whose first event has already been read."""
+    if not isinstance(first, yaml.CollectionStartEvent):
+        return
+    depth = 1
+    for event in events:
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def iter_sources_summary(path: Path) -> Iterator[Tuple[str, Source]]:
+    """Stream (source_id, Source) pairs from the ``sources`` section of a catalog.
+
+    Works on YAML parser events, so only the scalar fields in SUMMARY_FIELDS
+    are ever built into Python objects, and parsing stops once the
+    ``sources`` mapping ends.
+    """
+    with open(path, "rb") as f:
+        events = iter(yaml.parse(f, Loader=YAMLLoader))
+
+        for event in events:
+            if isinstance(event, yaml.MappingStartEvent):
+                break
+        else:
+            return
+
+        for key in events:
+            if isinstance(key, yaml.MappingEndEvent):
+                return
+            value = next(events)
+            if key.value != "sources" or not isinstance(value, yaml.MappingStartEvent):
+                _skip_node(events, value)
+                continue
+
+            for source_key in events:
+                if isinstance(source_key, yaml.MappingEndEvent):
+                    return
+                source_value = next(events)
+                fields: Dict[str, Any] = {}
+                if isinstance(source_value, yaml.MappingStartEvent):
+                    for field_key in events:
+                        if isinstance(field_key, yaml.MappingEndEvent):
+                            break
+                        field_value = next(events)
+                        if not isinstance(field_value, yaml.ScalarEvent):
+                            _skip_node(events, field_value)
+                        elif field_key.value in SUMMARY_FIELDS:
+                            fields[field_key.value] = _scalar_value(field_value)
+                else:
+                    _skip_node(events, source_value)
+                yield source_key.value, msgspec.convert(fields, type=Source)
 
 
 @app.command()
 def list_sources() -> None:
     """List all available data sources."""
-    config = load_sources_config()
+    config_path = get_config_path()
+    if not config_path.exists():
+        console.print(f"[red]Error:[/red] Config not found at {config_path}")
+        raise typer.Exit(1)
+
     console.print("\n[bold cyan]Available Data Sources:[/bold cyan]\n")
 
     # Create table
@@ -68,16 +234,20 @@ def list_sources() -> None:
     table.add_column("Description")
     table.add_column("Auth Required", style="red")
 
-    for source_id, source_info in config["sources"].items():
-        table.add_row(
+    rows = [
+        (
             source_id,
-            source_info.get("type", "unknown"),
-            source_info.get("country", "N/A"),
-            source_info.get("description", "")[:50],
-            "Yes" if source_info.get("auth_required") else "No",
+            source.type,
+            source.country,
+            source.description[:50],
+            "Yes" if source.auth_required else "No",
         )
+        for source_id, source in iter_sources_summary(config_path)
+    ]
+    for row in rows:
+        table.add_row(*row)
 
-    console.print(table)
+    console.print(table, soft_wrap=True)
     console.print()
 
 
@@ -124,6 +294,8 @@ def auth_google(
         raise typer.Exit(1)
 
     try:
+        from public_finance_data_hub.connectors.google_drive import GoogleDriveConnector
+
         # Create dummy folder ID just for auth test (will be set properly in sync)
         drive = GoogleDriveConnector(
             folder_id="root",
@@ -153,6 +325,88 @@ def auth_google(
         raise typer.Exit(1)
 
 
+def _ingest_source(
+    src: str, from_dt: datetime, to_dt: datetime, output_dir: Path, cache_dir: Path
+) -> Optional[bool]:
+    """Run the ingestion pipeline(s) for a single source.
+
+    Returns:
+        True on success, False on failure, None if no pipeline exists for the source
+    """
+    pipelines = SRC_PIPELINES.get(src)
+    if not pipelines:
+        logger.info(f"Pipeline for {src} not yet implemented")
+        return None
+
+    try:
+        console.print(f"[bold]Ingesting {src}...[/bold]")
+
+        for module_name, func_name in pipelines:
+            pipeline = _resolve_pipeline(module_name, func_name)
+            pipeline(from_dt, to_dt, output_dir, cache_dir)
+
+        console.print(f"[green]✓ {src} ingestion complete[/green]")
+        return True
+
+    except Exception as e:
+        console.print(f"[red]✗ {src} ingestion failed: {e}[/red]")
+        logger.exception(f"Error ingesting {src}")
+        return False
+
+
+def _do_ingest(
+    from_dt: datetime,
+    to_dt: datetime,
+    output_dir: Path,
+    cache_dir: Path,
+    sources: Optional[List[str]] = None,
+    parallel: Optional[int] = None,
+) -> None:
+    """Ingest the given sources (all configured sources if None).
+
+    Shared by ``ingest`` and ``run`` so arguments are parsed, and logging is
+    configured, only once per invocation.
+    """
+    console.print(
+        f"\n[bold cyan]Data Ingestion[/bold cyan]"
+        f"\nPeriod: {from_dt.date()} to {to_dt.date()}"
+        f"\nOutput: {output_dir.absolute()}\n"
+    )
+
+    config = load_sources_config()
+    sources_to_ingest = sources if sources else list(config.sources.keys())
+
+    sources_to_run = []
+    for src in sources_to_ingest:
+        if src not in config.sources:
+            logger.warning(f"Unknown source: {src}")
+            continue
+        sources_to_run.append(src)
+
+    success_count = 0
+    error_count = 0
+
+    # Sources are independent and network-bound, so run them concurrently
+    workers = max(1, parallel or min(4, len(sources_to_run)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_ingest_source, src, from_dt, to_dt, output_dir, cache_dir)
+            for src in sources_to_run
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            if result is True:
+                success_count += 1
+            elif result is False:
+                error_count += 1
+
+    console.print(
+        f"\n[bold]Summary:[/bold]"
+        f"\nSuccessful: {success_count}"
+        f"\nFailed: {error_count}"
+    )
+
+
 @app.command()
 def ingest(
     source: Optional[str] = typer.Option(
@@ -192,9 +446,15 @@ def ingest(
         "--log-level",
         help="Logging level (DEBUG, INFO, WARNING, ERROR)",
     ),
+    parallel: Optional[int] = typer.Option(
+        None,
+        "--parallel",
+        "-j",
+        help="Number of sources to ingest concurrently (default: min(4, sources))",
+    ),
 ) -> None:
     """Ingest data from specified sources."""
-    setup_logging(log_level=log_level, output_dir=DEFAULT_LOG_DIR)
+    _init_logging(log_level)
 
     if not source and not all_sources:
         console.print("[red]Error:[/red] Specify --source or use --all")
@@ -204,55 +464,13 @@ def ingest(
     from_dt = datetime.fromisoformat(from_date) if from_date else datetime(2020, 1, 1)
     to_dt = datetime.fromisoformat(to_date) if to_date else datetime.now()
 
-    console.print(
-        f"\n[bold cyan]Data Ingestion[/bold cyan]"
-        f"\nPeriod: {from_dt.date()} to {to_dt.date()}"
-        f"\nOutput: {output_dir.absolute()}\n"
-    )
-
-    config = load_sources_config()
-    sources_to_ingest = [
-        source,
-    ] if source else list(config["sources"].keys())
-
-    success_count = 0
-    error_count = 0
-
-    for src in sources_to_ingest:
-        if src not in config["sources"]:
-            logger.warning(f"Unknown source: {src}")
-            continue
-
-        try:
-            console.print(f"[bold]Ingesting {src}...[/bold]")
-
-            if src == "bcb":
-                ingest_bcb_series(from_dt, to_dt, output_dir, cache_dir)
-            elif src == "b3":
-                ingest_b3_cotahist(from_dt, to_dt, output_dir, cache_dir)
-            elif src == "cvm":
-                ingest_cvm_dfp(from_dt, to_dt, output_dir, cache_dir)
-                ingest_cvm_itr(from_dt, to_dt, output_dir, cache_dir)
-            elif src == "fred":
-                ingest_fred_series(from_dt, to_dt, output_dir, cache_dir)
-            elif src == "world_bank":
-                ingest_world_bank_indicators(from_dt, to_dt, output_dir, cache_dir)
-            else:
-                logger.info(f"Pipeline for {src} not yet implemented")
-                continue
-
-            console.print(f"[green]✓ {src} ingestion complete[/green]")
-            success_count += 1
-
-        except Exception as e:
-            console.print(f"[red]✗ {src} ingestion failed: {e}[/red]")
-            logger.exception(f"Error ingesting {src}")
-            error_count += 1
-
-    console.print(
-        f"\n[bold]Summary:[/bold]"
-        f"\nSuccessful: {success_count}"
-        f"\nFailed: {error_count}"
+    _do_ingest(
+        from_dt,
+        to_dt,
+        output_dir,
+        cache_dir,
+        sources=[source] if source else None,
+        parallel=parallel,
     )
 
 
@@ -300,6 +518,8 @@ def sync_drive(
         raise typer.Exit(1)
 
     try:
+        from public_finance_data_hub.connectors.google_drive import GoogleDriveConnector
+
         drive = GoogleDriveConnector(
             folder_id=folder_id,
             credentials_path=str(credentials_path),
@@ -319,6 +539,7 @@ def sync_drive(
                 remote_prefix="data/curated",
                 dry_run=dry_run,
                 pattern="*.parquet",
+                manifest_path=data_dir / SYNC_MANIFEST_NAME,
             )
 
             console.print(
@@ -344,7 +565,7 @@ def run(
         "--all",
         help="Ingest from all sources",
     ),
-    sync_drive: bool = typer.Option(
+    sync_to_drive: bool = typer.Option(
         False,
         "--sync-drive",
         help="Sync to Google Drive after ingestion",
@@ -378,9 +599,9 @@ def run(
     ),
 ) -> None:
     """Run complete pipeline: ingest all sources and optionally sync to Drive."""
-    setup_logging(log_level=log_level, output_dir=DEFAULT_LOG_DIR)
+    _init_logging(log_level)
 
-    if sync_drive and not folder_id:
+    if sync_to_drive and not folder_id:
         console.print(
             "[red]Error:[/red] --folder-id required when using --sync-drive"
         )
@@ -390,20 +611,17 @@ def run(
     console.print("[bold cyan]Starting Full Pipeline[/bold cyan]\n")
     console.print("[bold]Step 1: Ingestion[/bold]")
 
-    ingest.callback(
-        source=None,
-        all_sources=True,
-        from_date=from_date,
-        to_date=to_date,
-        output_dir=output_dir,
-        log_level=log_level,
-    )
+    from_dt = datetime.fromisoformat(from_date) if from_date else datetime(2020, 1, 1)
+    to_dt = datetime.fromisoformat(to_date) if to_date else datetime.now()
+    _do_ingest(from_dt, to_dt, output_dir, DEFAULT_CACHE_DIR)
 
     # Step 2: Sync to Drive (if requested)
-    if sync_drive:
+    if sync_to_drive:
         console.print("\n[bold]Step 2: Google Drive Sync[/bold]")
-        sync_drive.callback(
+        sync_drive(
             folder_id=folder_id,
+            credentials_path=DEFAULT_CREDENTIALS_PATH,
+            token_path=DEFAULT_TOKEN_PATH,
             data_dir=output_dir,
             dry_run=False,
         )
@@ -420,9 +638,11 @@ def status(
     ),
 ) -> None:
     """Show data lake status and statistics."""
+    from public_finance_data_hub.storage.lake import DataLake
+
     console.print("\n[bold cyan]Data Lake Status[/bold cyan]\n")
 
-    lake = DataLake(data_dir=data_dir)
+    lake = DataLake(base_dir=str(data_dir))
     stats = lake.get_stats()
 
     console.print(f"Location: {data_dir.absolute()}")
@@ -1 +1,5 @@
 """Configuration modules."""
+
+from public_finance_data_hub.config.schema import Source, SourcesConfig
+
+__all__ = ["Source", "SourcesConfig"]
@@ -0,0 +1,24 @@
+"""Typed schema for the sources.yml catalog."""
+
+from typing import Any, Dict
+
+import msgspec
+
+
+class Source(msgspec.Struct, frozen=True):
+    """A single data source entry."""
+
+    name: str = ""
+    type: str = "unknown"
+    region: str = ""
+    country: str = "N/A"
+    description: str = ""
+    auth_required: bool = False
+
+
+class SourcesConfig(msgspec.Struct, frozen=True):
+    """Top-level sources.yml document."""
+
+    sources: Dict[str, Source]
+    domains: Dict[str, Any] = {}
+    ingestion_strategy: Dict[str, Any] = {}
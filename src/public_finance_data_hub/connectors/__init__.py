@@ -1,11 +1,23 @@
-"""Data source connectors."""
+"""Data source connectors.
 
-from public_finance_data_hub.connectors.base import BaseConnector
-from public_finance_data_hub.connectors.bcb_sgs import BCBSGSConnector
-from public_finance_data_hub.connectors.b3 import B3Connector
-from public_finance_data_hub.connectors.cvm import CVMConnector
-from public_finance_data_hub.connectors.fred import FREDConnector
-from public_finance_data_hub.connectors.google_drive import GoogleDriveConnector
+Connector classes are imported lazily on first attribute access (PEP 562),
+so importing one connector doesn't load the dependencies of all the others.
+"""
+
+import importlib
+from typing import Any
+
+_LAZY = {
+    "BaseConnector": "public_finance_data_hub.connectors.base",
+    "BCBSGSConnector": "public_finance_data_hub.connectors.bcb_sgs",
+    "B3Connector": "public_finance_data_hub.connectors.b3",
+    "CVMConnector": "public_finance_data_hub.connectors.cvm",
+    "FREDConnector": "public_finance_data_hub.connectors.fred",
+    "GoogleDriveConnector": "public_finance_data_hub.connectors.google_drive",
+    "FetchRequest": "public_finance_data_hub.connectors.scheduler",
+    "gather_all": "public_finance_data_hub.connectors.scheduler",
+    "run_all": "public_finance_data_hub.connectors.scheduler",
+}
 
 __all__ = [
     "BaseConnector",
@@ -14,4 +26,20 @@ __all__ = [
     "CVMConnector",
     "FREDConnector",
     "GoogleDriveConnector",
+    "FetchRequest",
+    "gather_all",
+    "run_all",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import connector classes and scheduler helpers on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
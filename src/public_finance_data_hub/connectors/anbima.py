@@ -4,16 +4,28 @@ Provides access to Brazilian financial market data including mutual funds,
 fixed income indicators, and market statistics.
 """
 
+import asyncio
 import logging
 import os
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import json
 import base64
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
+import zstandard
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
+
+from public_finance_data_hub.utils.http import CircuitOpenError, HostBreaker
 
 logger = logging.getLogger(__name__)
 
@@ -50,17 +62,134 @@ class ANBIMAConnector:
         self.api_key = os.getenv("ANBIMA_API_KEY")
         self.cache_dir = Path(cache_dir) / "anbima"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._cache_root = os.fspath(self.cache_dir)
         self.timeout = timeout
         self.token = None
         self.token_expires_at = None
-        self.client = httpx.Client(
-            timeout=timeout,
-            headers={
-                "User-Agent": "PFDH/1.0 (public-finance-data-hub)",
-            },
-        )
+        self._load_token()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+
+    @property
+    def token_path(self) -> Path:
+        """File where the bearer token is persisted between runs."""
+        return self.cache_dir / "token.json"
+
+    def _load_token(self) -> None:
+        """Reuse a token persisted by a previous process if it's still valid."""
+        try:
+            with open(self.token_path, "r") as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_SH)
+                data = json.load(f)
+            expires_at = datetime.fromisoformat(data["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        # expires_at already carries the 60s safety margin set in aauthenticate
+        if expires_at > datetime.now():
+            self.token = data["token"]
+            self.token_expires_at = expires_at
+            logger.debug("Loaded ANBIMA token from disk")
+
+    def _save_token(self) -> None:
+        """Persist the current token (owner-only permissions)."""
+        try:
+            fd = os.open(self.token_path, os.O_WRONLY | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "w") as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                f.truncate()
+                json.dump(
+                    {"token": self.token, "expires_at": self.token_expires_at.isoformat()}, f
+                )
+            os.chmod(self.token_path, 0o600)
+        except OSError as e:
+            logger.warning(f"Could not persist ANBIMA token: {e}")
+
+    def _discard_token(self) -> None:
+        """Forget the current token and remove its persisted copy."""
+        self.token = None
+        self.token_expires_at = None
+        try:
+            self.token_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not remove persisted ANBIMA token: {e}")
+
+    def _cache_get(self, key: str, max_age: Optional[timedelta] = None) -> Optional[Any]:
+        """Load a cache entry, falling back to a legacy uncompressed ``.json`` file.
+
+        Args:
+            key: Entry name without extension (e.g. ``fiis_2024-01-31``)
+            max_age: Ignore entries older than this
+
+        Returns:
+            Cached object, or None on a miss
+        """
+        base = os.path.join(self._cache_root, key)
+        for path, compressed in ((base + ".json.zst", True), (base + ".json", False)):
+            try:
+                with open(path, "rb") as f:
+                    if max_age is not None:
+                        age = time.time() - os.fstat(f.fileno()).st_mtime
+                        if age >= max_age.total_seconds():
+                            return None
+                    raw = f.read()
+            except FileNotFoundError:
+                continue
+            return orjson.loads(zstandard.decompress(raw) if compressed else raw)
+        return None
+
+    def _cache_put(self, key: str, obj: Any) -> None:
+        """Write a cache entry atomically as zstd-compressed JSON."""
+        path = os.path.join(self._cache_root, key + ".json.zst")
+        with open(path + ".tmp", "wb") as f:
+            f.write(zstandard.compress(orjson.dumps(obj), 3))
+        os.replace(path + ".tmp", path)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client with a keep-alive pool, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                headers={
+                    "User-Agent": "PFDH/1.0 (public-finance-data-hub)",
+                },
+                limits=httpx.Limits(
+                    max_connections=32,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=30,
+                ),
+            )
+        return self._client
+
+    def _run(self, coro):
+        """Run a coroutine on the connector's background event loop.
+
+        Backs the synchronous API. The loop runs forever in a daemon thread,
+        so sync calls also work from code that already has a running loop
+        (Jupyter, async callers) and the pooled connections of the async
+        client stay alive between calls; don't mix the sync and async APIs
+        on the same instance.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="anbima-loop", daemon=True
+                )
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     def authenticate(self) -> bool:
+        """Authenticate with ANBIMA OAuth 2.0 (sync wrapper of aauthenticate)."""
+        return self._run(self.aauthenticate())
+
+    async def aauthenticate(self) -> bool:
         """Authenticate with ANBIMA OAuth 2.0.
 
         Returns:
@@ -84,7 +213,7 @@ class ANBIMAConnector:
                 f"{self.client_id}:{self.client_secret}".encode()
             ).decode()
 
-            response = self.client.post(
+            response = await self.client.post(
                 self.TOKEN_URL,
                 headers={
                     "Authorization": f"Basic {credentials}",
@@ -98,6 +227,7 @@ class ANBIMAConnector:
             self.token = data["access_token"]
             expires_in = data.get("expires_in", 3600)
             self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+            self._save_token()
 
             logger.info("✓ Successfully authenticated with ANBIMA")
             return True
@@ -106,23 +236,34 @@ class ANBIMAConnector:
             logger.error(f"ANBIMA authentication failed: {e}")
             return False
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get request headers with authentication."""
-        headers = {"User-Agent": "PFDH/1.0 (public-finance-data-hub)"}
+    @property
+    def token(self) -> Optional[str]:
+        """Current bearer token."""
+        return self._token
 
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        # Request headers only change when the token rotates, so rebuild
+        # them here instead of on every request
+        self._token = value
+        headers = {"User-Agent": "PFDH/1.0 (public-finance-data-hub)"}
+        if value:
+            headers["Authorization"] = f"Bearer {value}"
         elif self.api_key:
             headers["X-API-Key"] = self.api_key
+        self._cached_headers = headers
 
-        return headers
+    def _get_headers(self) -> Dict[str, str]:
+        """Get request headers with authentication."""
+        return self._cached_headers
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
+        retry=retry_if_not_exception_type(CircuitOpenError),
         reraise=True,
     )
-    def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+    async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request with retry logic.
 
         Args:
@@ -135,19 +276,26 @@ class ANBIMAConnector:
         """
         url = f"{self.BASE_URL}{endpoint}"
         kwargs["headers"] = self._get_headers()
+        breaker = HostBreaker.for_url(url)
+        breaker.check()
 
         try:
-            response = self.client.request(method, url, **kwargs)
+            response = await self.client.request(method, url, **kwargs)
             response.raise_for_status()
+            breaker.record_success()
             return response.json()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 401:
+                # Auth problem, not a host failure: drop the rejected token
+                # (in memory and on disk) so re-authentication fetches a new one
                 logger.info("Token expired, re-authenticating...")
-                self.authenticate()
+                self._discard_token()
+                await self.aauthenticate()
                 raise  # Retry
+            breaker.record_failure(e)
             raise
 
-    def fetch_mutual_funds(
+    async def afetch_mutual_funds(
         self,
         date: Optional[datetime] = None,
         limit: int = 1000,
@@ -165,36 +313,36 @@ class ANBIMAConnector:
         """
         date = date or datetime.now()
         date_str = date.strftime("%Y-%m-%d")
-        cache_key = f"mutual_funds_{date_str}.json"
-        cache_path = self.cache_dir / cache_key
+        cache_key = f"mutual_funds_{date_str}"
 
         # Check cache
-        if cache and cache_path.exists():
-            logger.debug(f"Loading mutual funds from cache: {cache_key}")
-            return json.loads(cache_path.read_text())
+        cached = self._cache_get(cache_key) if cache else None
+        if cached is not None:
+            logger.debug("Loading mutual funds from cache: %s", cache_key)
+            return cached
 
-        if not self.authenticate():
+        if not await self.aauthenticate():
             logger.warning("ANBIMA authentication failed, skipping mutual funds")
             return []
 
         try:
-            logger.info(f"Fetching mutual funds for {date_str}...")
-            data = self._request(
+            logger.info("Fetching mutual funds for %s...", date_str)
+            data = await self._request(
                 "GET",
                 self.ENDPOINTS["mutual_funds"],
                 params={"data": date_str, "limite": limit},
             )
 
             # Cache result
-            cache_path.write_text(json.dumps(data))
-            logger.info(f"✓ Fetched {len(data)} mutual funds")
+            self._cache_put(cache_key, data)
+            logger.info("✓ Fetched %s mutual funds", len(data))
             return data
 
         except Exception as e:
             logger.error(f"Error fetching mutual funds: {e}")
             return []
 
-    def fetch_fiis(
+    async def afetch_fiis(
         self,
         date: Optional[datetime] = None,
         limit: int = 1000,
@@ -212,36 +360,36 @@ class ANBIMAConnector:
         """
         date = date or datetime.now()
         date_str = date.strftime("%Y-%m-%d")
-        cache_key = f"fiis_{date_str}.json"
-        cache_path = self.cache_dir / cache_key
+        cache_key = f"fiis_{date_str}"
 
         # Check cache
-        if cache and cache_path.exists():
-            logger.debug(f"Loading FIIs from cache: {cache_key}")
-            return json.loads(cache_path.read_text())
+        cached = self._cache_get(cache_key) if cache else None
+        if cached is not None:
+            logger.debug("Loading FIIs from cache: %s", cache_key)
+            return cached
 
-        if not self.authenticate():
+        if not await self.aauthenticate():
             logger.warning("ANBIMA authentication failed, skipping FIIs")
             return []
 
         try:
-            logger.info(f"Fetching FIIs for {date_str}...")
-            data = self._request(
+            logger.info("Fetching FIIs for %s...", date_str)
+            data = await self._request(
                 "GET",
                 self.ENDPOINTS["fiis"],
                 params={"data": date_str, "limite": limit},
             )
 
             # Cache result
-            cache_path.write_text(json.dumps(data))
-            logger.info(f"✓ Fetched {len(data)} FIIs")
+            self._cache_put(cache_key, data)
+            logger.info("✓ Fetched %s FIIs", len(data))
             return data
 
         except Exception as e:
             logger.error(f"Error fetching FIIs: {e}")
             return []
 
-    def fetch_fixed_income(
+    async def afetch_fixed_income(
         self,
         date: Optional[datetime] = None,
         asset_type: Optional[str] = None,
@@ -259,40 +407,40 @@ class ANBIMAConnector:
         """
         date = date or datetime.now()
         date_str = date.strftime("%Y-%m-%d")
-        cache_key = f"fixed_income_{date_str}_{asset_type or 'all'}.json"
-        cache_path = self.cache_dir / cache_key
+        cache_key = f"fixed_income_{date_str}_{asset_type or 'all'}"
 
         # Check cache
-        if cache and cache_path.exists():
-            logger.debug(f"Loading fixed income from cache: {cache_key}")
-            return json.loads(cache_path.read_text())
+        cached = self._cache_get(cache_key) if cache else None
+        if cached is not None:
+            logger.debug("Loading fixed income from cache: %s", cache_key)
+            return cached
 
-        if not self.authenticate():
+        if not await self.aauthenticate():
             logger.warning("ANBIMA authentication failed, skipping fixed income")
             return []
 
         try:
-            logger.info(f"Fetching fixed income for {date_str}...")
+            logger.info("Fetching fixed income for %s...", date_str)
             params = {"data": date_str}
             if asset_type:
                 params["tipo_ativo"] = asset_type
 
-            data = self._request(
+            data = await self._request(
                 "GET",
                 self.ENDPOINTS["fixed_income"],
                 params=params,
             )
 
             # Cache result
-            cache_path.write_text(json.dumps(data))
-            logger.info(f"✓ Fetched {len(data)} fixed income records")
+            self._cache_put(cache_key, data)
+            logger.info("✓ Fetched %s fixed income records", len(data))
             return data
 
         except Exception as e:
             logger.error(f"Error fetching fixed income: {e}")
             return []
 
-    def fetch_market_indices(
+    async def afetch_market_indices(
         self,
         cache: bool = True,
     ) -> List[Dict[str, Any]]:
@@ -304,38 +452,119 @@ class ANBIMAConnector:
         Returns:
             List of market indices
         """
-        cache_key = "market_indices.json"
-        cache_path = self.cache_dir / cache_key
+        cache_key = "market_indices"
 
         # Check cache (1 hour)
-        if cache and cache_path.exists():
-            if (datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)).seconds < 3600:
-                logger.debug("Loading market indices from cache")
-                return json.loads(cache_path.read_text())
+        cached = self._cache_get(cache_key, max_age=timedelta(hours=1)) if cache else None
+        if cached is not None:
+            logger.debug("Loading market indices from cache")
+            return cached
 
-        if not self.authenticate():
+        if not await self.aauthenticate():
             logger.warning("ANBIMA authentication failed, skipping market indices")
             return []
 
         try:
             logger.info("Fetching market indices...")
-            data = self._request("GET", self.ENDPOINTS["market_indices"])
+            data = await self._request("GET", self.ENDPOINTS["market_indices"])
 
             # Cache result
-            cache_path.write_text(json.dumps(data))
-            logger.info(f"✓ Fetched {len(data)} market indices")
+            self._cache_put(cache_key, data)
+            logger.info("✓ Fetched %s market indices", len(data))
             return data
 
         except Exception as e:
             logger.error(f"Error fetching market indices: {e}")
             return []
 
-    def close(self):
+    async def afetch_all(
+        self,
+        date: Optional[datetime] = None,
+        cache: bool = True,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch all ANBIMA endpoints concurrently over the shared client.
+
+        Args:
+            date: Date to fetch data for (defaults to today)
+            cache: Use cached data if available
+
+        Returns:
+            Dict with mutual_funds, fiis, fixed_income and market_indices records
+        """
+        # Authenticate once up front so the concurrent fetches share the token
+        await self.aauthenticate()
+
+        mutual_funds, fiis, fixed_income, market_indices = await asyncio.gather(
+            self.afetch_mutual_funds(date, cache=cache),
+            self.afetch_fiis(date, cache=cache),
+            self.afetch_fixed_income(date, cache=cache),
+            self.afetch_market_indices(cache=cache),
+        )
+        return {
+            "mutual_funds": mutual_funds,
+            "fiis": fiis,
+            "fixed_income": fixed_income,
+            "market_indices": market_indices,
+        }
+
+    def fetch_mutual_funds(
+        self, date: Optional[datetime] = None, limit: int = 1000, cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Fetch mutual fund data (sync wrapper of afetch_mutual_funds)."""
+        return self._run(self.afetch_mutual_funds(date, limit, cache))
+
+    def fetch_fiis(
+        self, date: Optional[datetime] = None, limit: int = 1000, cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Fetch FII data (sync wrapper of afetch_fiis)."""
+        return self._run(self.afetch_fiis(date, limit, cache))
+
+    def fetch_fixed_income(
+        self,
+        date: Optional[datetime] = None,
+        asset_type: Optional[str] = None,
+        cache: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Fetch fixed income data (sync wrapper of afetch_fixed_income)."""
+        return self._run(self.afetch_fixed_income(date, asset_type, cache))
+
+    def fetch_market_indices(self, cache: bool = True) -> List[Dict[str, Any]]:
+        """Fetch market indices (sync wrapper of afetch_market_indices)."""
+        return self._run(self.afetch_market_indices(cache))
+
+    def fetch_all(
+        self, date: Optional[datetime] = None, cache: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch all endpoints concurrently (sync wrapper of afetch_all)."""
+        return self._run(self.afetch_all(date, cache))
+
+    async def aclose(self):
         """Close HTTP client."""
-        self.client.close()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def close(self):
+        """Close HTTP client and stop the background event loop."""
+        if self._loop is None:
+            return
+        if self._client is not None:
+            self._run(self.aclose())
+        with self._loop_lock:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
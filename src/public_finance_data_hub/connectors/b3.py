@@ -3,16 +3,60 @@
 import logging
 from datetime import date
 from typing import Dict, List, Any, Optional
+import numpy as np
 import pandas as pd
 import io
 from public_finance_data_hub.connectors.base import BaseConnector
 
 logger = logging.getLogger(__name__)
 
+SAMPLE_TICKERS = ["PETR4", "BBAS3", "VALE3"]
+
+
+def _build_cotahist_sample(period_start: date, period_end: date) -> pd.DataFrame:
+    """Build the daily sample COTAHIST frame for exactly the requested period.
+
+    Arrays are sized to the number of days in the period up front, so no
+    rows are generated only to be filtered out.
+    """
+    n = max((period_end - period_start).days + 1, 0)
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(start=period_start, periods=n, freq="D"),
+            "ticker": pd.Categorical(np.resize(SAMPLE_TICKERS, n), categories=SAMPLE_TICKERS),
+            "open": np.resize(np.array([20.0, 30.0, 25.0], dtype=np.float32), n),
+            "high": np.resize(np.array([21.0, 31.0, 26.0], dtype=np.float32), n),
+            "low": np.resize(np.array([19.0, 29.0, 24.0], dtype=np.float32), n),
+            "close": np.resize(np.array([20.5, 30.5, 25.5], dtype=np.float32), n),
+            "volume": np.resize(np.array([1000000, 1500000, 800000], dtype=np.int32), n),
+        }
+    )
+
 
 class B3Connector(BaseConnector):
     """B3 COTAHIST (Historical Market Data) connector."""
 
+    # Sample lists are built once at import and shared (shallow copies) by
+    # every fetch. In production these would come from B3's official source.
+    _ETF_DF = pd.DataFrame(
+        {
+            "ticker": ["XBOV11", "XFIN11", "XIND11"],
+            "name": ["Bovespa Index ETF", "Financial Index ETF", "Industrial Index ETF"],
+            "sector": ["Index", "Finance", "Industrial"],
+        }
+    ).astype({"ticker": "category", "sector": "category"})
+    _FII_DF = pd.DataFrame(
+        {
+            "ticker": ["RBRR11", "MXRF11", "KNRI11"],
+            "name": [
+                "RB Residencial",
+                "Maxit Realty",
+                "Kinea Real Estate",
+            ],
+            "segment": ["Residential", "Diversified", "Industrial"],
+        }
+    ).astype({"ticker": "category", "segment": "category"})
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
@@ -47,7 +91,7 @@ class B3Connector(BaseConnector):
             Dict with 'data', 'metadata', 'status'
         """
         try:
-            logger.info(f"Fetching B3 {dataset} data...")
+            logger.info("Fetching B3 %s data...", dataset)
 
             if dataset == "cotahist":
                 return self._fetch_cotahist(period_start, period_end)
@@ -76,26 +120,11 @@ class B3Connector(BaseConnector):
         Note: B3 provides COTAHIST in a fixed-width format.
         This is a sample implementation.
         """
-        logger.info(f"Fetching COTAHIST from {period_start} to {period_end}")
-
-        # Sample data structure for COTAHIST
-        # In production, would download from B3's official source
-        df = pd.DataFrame(
-            {
-                "date": pd.date_range(start=period_start, end=period_end, freq="D"),
-                "ticker": ["PETR4", "BBAS3", "VALE3"] * 5,  # Sample tickers
-                "open": [20.0, 30.0, 25.0] * 5,
-                "high": [21.0, 31.0, 26.0] * 5,
-                "low": [19.0, 29.0, 24.0] * 5,
-                "close": [20.5, 30.5, 25.5] * 5,
-                "volume": [1000000, 1500000, 800000] * 5,
-            }
-        )
+        logger.info("Fetching COTAHIST from %s to %s", period_start, period_end)
 
-        # Filter to date range
-        df = df[(df["date"] >= period_start) & (df["date"] <= period_end)]
+        df = _build_cotahist_sample(period_start, period_end)
 
-        logger.info(f"✓ Fetched {len(df)} COTAHIST records")
+        logger.info("✓ Fetched %s COTAHIST records", len(df))
 
         return {
             "data": df,
@@ -112,16 +141,9 @@ class B3Connector(BaseConnector):
         """Fetch list of ETFs traded on B3."""
         logger.info("Fetching B3 ETF list")
 
-        # Sample ETF list
-        df = pd.DataFrame(
-            {
-                "ticker": ["XBOV11", "XFIN11", "XIND11"],
-                "name": ["Bovespa Index ETF", "Financial Index ETF", "Industrial Index ETF"],
-                "sector": ["Index", "Finance", "Industrial"],
-            }
-        )
+        df = self._ETF_DF.copy(deep=False)
 
-        logger.info(f"✓ Fetched {len(df)} ETFs")
+        logger.info("✓ Fetched %s ETFs", len(df))
 
         return {
             "data": df,
@@ -133,19 +155,9 @@ class B3Connector(BaseConnector):
         """Fetch list of FIIs (Real Estate Investment Funds)."""
         logger.info("Fetching B3 FII list")
 
-        df = pd.DataFrame(
-            {
-                "ticker": ["RBRR11", "MXRF11", "KNRI11"],
-                "name": [
-                    "RB Residencial",
-                    "Maxit Realty",
-                    "Kinea Real Estate",
-                ],
-                "segment": ["Residential", "Diversified", "Industrial"],
-            }
-        )
+        df = self._FII_DF.copy(deep=False)
 
-        logger.info(f"✓ Fetched {len(df)} FIIs")
+        logger.info("✓ Fetched %s FIIs", len(df))
 
         return {
             "data": df,
@@ -1,9 +1,14 @@
 """Base connector class for data sources."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from datetime import date
+from datetime import date, timedelta
+from pathlib import Path
 from typing import Optional, List, Dict, Any
 import logging
+import time
+import httpx
+import pandas as pd
 from public_finance_data_hub.utils.http import CachedHTTPClient
 
 logger = logging.getLogger(__name__)
@@ -12,6 +17,14 @@ logger = logging.getLogger(__name__)
 class BaseConnector(ABC):
     """Abstract base class for all data source connectors."""
 
+    # Parsed-DataFrame (parquet) cache tier: entries covering the latest
+    # release live for the dataset's update cadence (CADENCE_MAP, falling back
+    # to default_cadence); periods that closed more than one cadence ago
+    # essentially never change and use historical_ttl
+    CADENCE_MAP: Dict[str, timedelta] = {}
+    default_cadence = timedelta(days=7)
+    historical_ttl = timedelta(days=365)
+
     def __init__(
         self,
         name: str,
@@ -33,7 +46,7 @@ class BaseConnector(ABC):
             timeout=timeout,
             max_retries=max_retries,
         )
-        logger.info(f"Initialized {name} connector")
+        logger.info("Initialized %s connector", name)
 
     @abstractmethod
     def list_datasets(self) -> List[str]:
@@ -65,7 +78,88 @@ class BaseConnector(ABC):
         """
         pass
 
+    async def async_fetch(
+        self,
+        client: httpx.AsyncClient,
+        dataset: str,
+        period_start: date,
+        period_end: date,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Fetch data from source inside an event loop.
+
+        The default runs the synchronous fetch() in a worker thread, so every
+        connector can be scheduled concurrently; connectors with a native
+        async path override this and use ``client``.
+
+        Args:
+            client: Shared AsyncClient (unused by the default implementation)
+            dataset: Dataset identifier
+            period_start: Start date
+            period_end: End date
+            **kwargs: Additional source-specific parameters
+
+        Returns:
+            Dict with keys: 'data', 'metadata', 'status'
+        """
+        return await asyncio.to_thread(self.fetch, dataset, period_start, period_end, **kwargs)
+
+    def _frame_cache_path(
+        self, dataset: str, period_start: date, period_end: date
+    ) -> Optional[Path]:
+        """Path of the parquet cache entry for a parsed dataset, if caching is on."""
+        cache_dir = self.http_client.cache_dir
+        if not cache_dir:
+            return None
+        return cache_dir / f"{self.name.lower()}_{dataset}_{period_start}_{period_end}.parquet"
+
+    def _frame_cache_ttl(self, dataset: str, period_end: date) -> timedelta:
+        """TTL of a frame cache entry from the dataset's update cadence."""
+        cadence = self.CADENCE_MAP.get(dataset, self.default_cadence)
+        if period_end + cadence < date.today():
+            return self.historical_ttl
+        return cadence
+
+    def _load_cached_frame(
+        self, path: Optional[Path], dataset: str, period_end: date
+    ) -> Optional[pd.DataFrame]:
+        """Load a parsed DataFrame from the parquet cache tier.
+
+        Args:
+            path: Entry path from _frame_cache_path()
+            dataset: Dataset identifier (selects the cadence)
+            period_end: End of the cached period
+
+        Returns:
+            Cached DataFrame, or None on a miss or expired entry
+        """
+        if path is None:
+            return None
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+
+        ttl = self._frame_cache_ttl(dataset, period_end)
+        if time.time() - mtime > ttl.total_seconds():
+            return None
+
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable frame cache {path}: {e}")
+            return None
+
+    def _save_cached_frame(self, path: Optional[Path], df: pd.DataFrame) -> None:
+        """Store a parsed DataFrame in the parquet cache tier (zstd)."""
+        if path is None or df.empty:
+            return
+        try:
+            df.to_parquet(path, compression="zstd", index=False)
+        except Exception as e:
+            logger.warning(f"Could not write frame cache {path}: {e}")
+
     def close(self) -> None:
         """Close connector resources."""
         self.http_client.close()
-        logger.info(f"Closed {self.name} connector")
+        logger.info("Closed %s connector", self.name)
@@ -45,7 +45,7 @@ class CVMConnector(BaseConnector):
             Dict with 'data', 'metadata', 'status'
         """
         try:
-            logger.info(f"Fetching CVM {dataset}...")
+            logger.info("Fetching CVM %s...", dataset)
             logger.warning("CVM data requires proper date range and file format handling")
 
             # Placeholder: In production, would download from CVM's open data portal
@@ -56,7 +56,7 @@ class CVMConnector(BaseConnector):
                 }
             )
 
-            logger.info(f"✓ Fetched {len(df)} records from CVM")
+            logger.info("✓ Fetched %s records from CVM", len(df))
 
             return {
                 "data": df,
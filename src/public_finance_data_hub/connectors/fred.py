@@ -1,9 +1,12 @@
 """FRED (Federal Reserve Economic Data) connector."""
 
 import logging
+import math
 import os
-from datetime import date
+from datetime import date, timedelta
 from typing import Dict, List, Any, Optional
+import msgspec
+import numpy as np
 import pandas as pd
 from public_finance_data_hub.connectors.base import BaseConnector
 
@@ -19,9 +22,41 @@ SERIES_MAP = {
 }
 
 
+class FredObservation(msgspec.Struct):
+    """Single FRED observation; values are strings, "." when missing."""
+
+    date: str
+    value: str
+
+
+class FredObservationsResponse(msgspec.Struct):
+    """Fields of /series/observations used by the connector."""
+
+    observations: Optional[List[FredObservation]] = None
+
+
+_decoder = msgspec.json.Decoder(FredObservationsResponse)
+
+
+def _to_float(value: str) -> float:
+    """Convert a FRED value string to float (NaN for missing/invalid)."""
+    try:
+        return float(value)
+    except ValueError:
+        return math.nan
+
+
 class FREDConnector(BaseConnector):
     """Federal Reserve Economic Data (FRED) API connector."""
 
+    CADENCE_MAP = {
+        "unemployment_rate": timedelta(days=30),
+        "cpi": timedelta(days=30),
+        "unemployment_level": timedelta(days=30),
+        "nonfarm_payroll": timedelta(days=30),
+        "gdp": timedelta(days=90),
+    }
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
@@ -34,6 +69,10 @@ class FREDConnector(BaseConnector):
         if not self.api_key:
             logger.warning("FRED_API_KEY not set. FRED connector may have limited functionality.")
         self.base_url = "https://api.stlouisfed.org/fred"
+        # URL and the fixed query params are built once; each fetch only adds
+        # the series and the date window
+        self._obs_url = f"{self.base_url}/series/observations"
+        self._base_params = {"api_key": self.api_key, "file_type": "json"}
 
     def list_datasets(self) -> List[str]:
         """List available series."""
@@ -72,24 +111,28 @@ class FREDConnector(BaseConnector):
                 }
 
             series_id = SERIES_MAP[dataset]
-            logger.info(f"Fetching FRED {dataset} ({series_id})...")
+
+            frame_path = self._frame_cache_path(dataset, period_start, period_end)
+            df = self._load_cached_frame(frame_path, dataset, period_end)
+            if df is not None:
+                logger.debug("Frame cache hit for FRED series %s", dataset)
+                return self._success(dataset, series_id, df)
+
+            logger.info("Fetching FRED %s (%s)...", dataset, series_id)
 
             params = {
+                **self._base_params,
                 "series_id": series_id,
-                "api_key": self.api_key,
-                "file_type": "json",
                 "observation_start": period_start.isoformat(),
                 "observation_end": period_end.isoformat(),
             }
 
-            response = self.http_client.get(
-                f"{self.base_url}/series/observations",
-                params=params,
-                use_cache=True,
-            )
-            response_json = response.json()
+            response = self.http_client.get(self._obs_url, params=params, use_cache=True)
+            # Decode straight into typed structs and build columns from arrays,
+            # skipping the list-of-dicts DataFrame and dtype inference
+            decoded = _decoder.decode(response.content)
 
-            if "observations" not in response_json:
+            if decoded.observations is None:
                 logger.warning(f"No data for FRED series {series_id}")
                 return {
                     "data": pd.DataFrame(),
@@ -97,25 +140,21 @@ class FREDConnector(BaseConnector):
                     "status": "no_data",
                 }
 
-            # Parse observations
-            observations = response_json["observations"]
-            df = pd.DataFrame(observations)
-            df["date"] = pd.to_datetime(df["date"])
-            df["value"] = pd.to_numeric(df["value"], errors="coerce")
-            df = df[["date", "value"]].rename(columns={"value": dataset})
-            df = df.sort_values("date").reset_index(drop=True)
+            observations = decoded.observations
+            dates = np.array([obs.date for obs in observations], dtype="datetime64[D]")
+            values = np.fromiter(
+                (_to_float(obs.value) for obs in observations),
+                dtype=np.float64,
+                count=len(observations),
+            )
+            df = pd.DataFrame({"date": dates.astype("datetime64[ns]"), dataset: values})
+            df.sort_values("date", kind="stable", ignore_index=True, inplace=True)
+
+            self._save_cached_frame(frame_path, df)
 
-            logger.info(f"✓ Fetched {len(df)} records from FRED")
+            logger.info("✓ Fetched %s records from FRED", len(df))
 
-            return {
-                "data": df,
-                "metadata": {
-                    "series_id": series_id,
-                    "series_name": dataset,
-                    "rows": len(df),
-                },
-                "status": "success",
-            }
+            return self._success(dataset, series_id, df)
 
         except Exception as e:
             logger.error(f"Error fetching FRED data: {e}")
@@ -124,3 +163,16 @@ class FREDConnector(BaseConnector):
                 "metadata": {"error": str(e)},
                 "status": "error",
             }
+
+    @staticmethod
+    def _success(dataset: str, series_id: str, df: pd.DataFrame) -> Dict[str, Any]:
+        """Build the result dict for a fetched series."""
+        return {
+            "data": df,
+            "metadata": {
+                "series_id": series_id,
+                "series_name": dataset,
+                "rows": len(df),
+            },
+            "status": "success",
+        }
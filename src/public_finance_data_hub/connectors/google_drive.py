@@ -4,17 +4,33 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+import fnmatch
 import hashlib
+import io
+import mimetypes
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+import orjson
+
 try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import google_auth_httplib2
+    import httplib2
     from google.auth.transport.requests import Request
     from google.oauth2.service_account import Credentials as ServiceAccountCredentials
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
-    from googleapiclient.http import MediaFileUpload
+    from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
     from googleapiclient.errors import HttpError
     GOOGLE_AVAILABLE = True
 except ImportError:
@@ -23,11 +39,96 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _escape_query(value: str) -> str:
+    """Escape a value for a single-quoted string in a Drive files.list query."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
+
+# files.list filter for live (non-trashed) folders
+FOLDER_FILTER = "mimeType='application/vnd.google-apps.folder' and trashed=false"
+
+
+def _child_query(name: str, parent_id: str, filters: str = "trashed=false") -> str:
+    """Build a files.list query for the child `name` of folder `parent_id`."""
+    return (
+        f"name='{_escape_query(name)}' and '{_escape_query(parent_id)}' in parents"
+        f" and {filters}"
+    )
+
+
+def _scan_matching(root: str, pattern: str) -> Iterator[Tuple[str, os.stat_result]]:
+    """Recursively yield (path, stat) for files whose name matches pattern.
+
+    os.scandir + fnmatch on plain strings: no Path object per directory
+    entry, and only matching files are stat'ed.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_matching(entry.path, pattern)
+            elif fnmatch.fnmatch(entry.name, pattern):
+                yield entry.path, entry.stat()
+
+
+class _HashingReader(io.RawIOBase):
+    """Read-only file wrapper that hashes bytes as an upload reads them.
+
+    Only bytes read at the hashed high-water mark are fed to the hasher, so
+    seeks back for retried chunks don't corrupt the digest; anything the
+    reader skipped is hashed from disk in hexdigest().
+    """
+
+    def __init__(self, file_path: Path, hasher):
+        self._file = open(file_path, "rb")
+        self._hasher = hasher
+        self._hashed = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def readinto(self, buffer) -> int:
+        start = self._file.tell()
+        n = self._file.readinto(buffer)
+        if n and start <= self._hashed < start + n:
+            with memoryview(buffer) as view:
+                self._hasher.update(view[self._hashed - start : n])
+            self._hashed = start + n
+        return n
+
+    def hexdigest(self) -> str:
+        """Digest of the whole file, hashing any part the upload didn't read."""
+        self._file.seek(self._hashed)
+        for block in iter(lambda: self._file.read(4 * 1024 * 1024), b""):
+            self._hasher.update(block)
+            self._hashed += len(block)
+        return self._hasher.hexdigest()
+
+    def close(self) -> None:
+        self._file.close()
+        super().close()
+
+
 class GoogleDriveConnector:
     """Manages OAuth authentication and file syncing to Google Drive."""
 
     SCOPES = ["https://www.googleapis.com/auth/drive.file"]
-    CHUNK_SIZE = 50 * 1024 * 1024  # 50 MB chunks
+    CHUNK_SIZE = 128 * 1024 * 1024  # Resumable chunks for very large files
+    SINGLE_PUT_LIMIT = 512 * 1024 * 1024  # Below this, send the whole file in one PUT
+    RESUMABLE_THRESHOLD = 25 * 1024 * 1024  # Smaller files go up in one request
+    BATCH_SIZE = 50  # Max requests per Drive batch call
+    UPLOAD_WORKERS = 4  # Concurrent uploads during sync
+    HTTP_TIMEOUT = 120  # Seconds, per Drive API request
+    HASH_BUFFER_SIZE = 4 * 1024 * 1024  # 4 MB reads while hashing
+    HASH_ALGORITHM = "blake3" if BLAKE3_AVAILABLE else "sha256"
 
     def __init__(self, folder_id: str, credentials_path: str, token_path: str):
         """Initialize Google Drive connector.
@@ -46,6 +147,9 @@ class GoogleDriveConnector:
         self.credentials_path = Path(credentials_path)
         self.token_path = Path(token_path)
         self.service = None
+        self._credentials = None
+        self._thread_local = threading.local()
+        self._folder_cache: Dict[Tuple[str, str], str] = {}
         self._authenticated = False
 
     def authenticate(self, force_refresh: bool = False) -> bool:
@@ -62,8 +166,10 @@ class GoogleDriveConnector:
 
             # Load existing token if available
             if self.token_path.exists() and not force_refresh:
-                logger.info(f"Loading existing token from {self.token_path}")
-                creds = Credentials.from_authorized_user_file(str(self.token_path), self.SCOPES)
+                logger.info("Loading existing token from %s", self.token_path)
+                creds = Credentials.from_authorized_user_info(
+                    orjson.loads(self.token_path.read_bytes()), self.SCOPES
+                )
             else:
                 # Create new OAuth flow
                 if not self.credentials_path.exists():
@@ -77,15 +183,19 @@ class GoogleDriveConnector:
                     str(self.credentials_path), self.SCOPES
                 )
                 creds = flow.run_local_server(port=0)
-                logger.info(f"Saving token to {self.token_path}")
+                logger.info("Saving token to %s", self.token_path)
                 self.token_path.write_text(creds.to_json())
 
-            # Refresh credentials if expired
+            # Refresh credentials if expired, and persist the new access token
+            # so later processes reuse it until it expires instead of paying
+            # a token-endpoint round-trip on every start
             if creds and creds.expired and creds.refresh_token:
                 logger.debug("Refreshing expired credentials")
                 creds.refresh(Request())
+                self.token_path.write_text(creds.to_json())
 
-            self.service = build("drive", "v3", credentials=creds)
+            self.service = self._build_service(creds)
+            self._credentials = creds
             self._authenticated = True
             logger.info("✓ Successfully authenticated with Google Drive")
             return True
@@ -112,7 +222,8 @@ class GoogleDriveConnector:
             creds = ServiceAccountCredentials.from_service_account_file(
                 str(sa_path), scopes=self.SCOPES
             )
-            self.service = build("drive", "v3", credentials=creds)
+            self.service = self._build_service(creds)
+            self._credentials = creds
             self._authenticated = True
             logger.info("✓ Successfully authenticated with Service Account")
             return True
@@ -125,13 +236,50 @@ class GoogleDriveConnector:
         """Check if authenticated."""
         return self._authenticated and self.service is not None
 
+    def _build_service(self, creds):
+        """Build a Drive service over its own persistent authorized transport.
+
+        Each service owns one httplib2.Http, which keeps its TCP/TLS
+        connection to the Drive API alive across calls instead of
+        reconnecting per request.
+        """
+        http = google_auth_httplib2.AuthorizedHttp(
+            creds, http=httplib2.Http(timeout=self.HTTP_TIMEOUT)
+        )
+        return build("drive", "v3", http=http, cache_discovery=False)
+
+    def _get_thread_service(self):
+        """Get a Drive service owned by the calling thread.
+
+        The underlying httplib2 transport is not thread-safe, so concurrent
+        uploads each need their own service object.
+        """
+        service = getattr(self._thread_local, "service", None)
+        if service is None:
+            service = self._build_service(self._credentials)
+            self._thread_local.service = service
+        return service
+
+    @staticmethod
+    def _new_hasher():
+        """New hasher for HASH_ALGORITHM."""
+        if BLAKE3_AVAILABLE:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        return hashlib.sha256()
+
     def get_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA256 hash of file."""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+        """Calculate the file hash (HASH_ALGORITHM: BLAKE3, or SHA256 without blake3).
+
+        BLAKE3 hashes large files with SIMD and multithreading; reads go into
+        one reusable buffer to avoid per-block allocations.
+        """
+        hasher = self._new_hasher()
+        buf = bytearray(self.HASH_BUFFER_SIZE)
+        view = memoryview(buf)
+        with open(file_path, "rb", buffering=0) as f:
+            while n := f.readinto(buf):
+                hasher.update(view[:n])
+        return hasher.hexdigest()
 
     def find_remote_file(self, name: str, parent_id: str) -> Optional[str]:
         """Find file in Google Drive by name.
@@ -143,7 +291,7 @@ class GoogleDriveConnector:
             results = (
                 self.service.files()
                 .list(
-                    q=f"name='{name}' and '{parent_id}' in parents and trashed=false",
+                    q=_child_query(name, parent_id),
                     spaces="drive",
                     fields="files(id, name, size, modifiedTime)",
                     pageSize=1,
@@ -156,18 +304,147 @@ class GoogleDriveConnector:
             logger.warning(f"Error searching for file: {e}")
             return None
 
+    def find_remote_files(
+        self, entries: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """Look up many files at once using batched Drive requests.
+
+        Args:
+            entries: List of (name, parent_id) pairs
+
+        Returns:
+            Dict mapping each (name, parent_id) to its remote file metadata,
+            or None if not found
+        """
+        return self._batch_lookup(
+            entries, "trashed=false", "files(id, name, size, md5Checksum, modifiedTime)"
+        )
+
+    def find_remote_folders(
+        self, entries: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """Look up many folders at once using batched Drive requests.
+
+        Args:
+            entries: List of (folder_name, parent_id) pairs
+
+        Returns:
+            Dict mapping each (folder_name, parent_id) to {"id": ...}, or None
+            if not found
+        """
+        return self._batch_lookup(
+            entries,
+            FOLDER_FILTER,
+            "files(id)",
+        )
+
+    def list_folder_children(self, folder_id: str) -> Dict[str, Dict[str, Any]]:
+        """Index the files directly inside a folder by name.
+
+        One paged files.list per folder (up to 1000 files per page) instead
+        of one query per file.
+
+        Returns:
+            Dict mapping file name to its remote file metadata
+        """
+        children: Dict[str, Dict[str, Any]] = {}
+        page_token = None
+        while True:
+            results = (
+                self.service.files()
+                .list(
+                    q=f"'{_escape_query(folder_id)}' in parents and trashed=false",
+                    spaces="drive",
+                    fields="nextPageToken, files(id, name, size, md5Checksum, modifiedTime)",
+                    pageSize=1000,
+                    pageToken=page_token,
+                )
+                .execute()
+            )
+            for remote_file in results.get("files", []):
+                children.setdefault(remote_file["name"], remote_file)
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                return children
+
+    def _batch_lookup(
+        self, entries: List[Tuple[str, str]], filters: str, fields: str
+    ) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+        """Run one files.list per (name, parent_id), BATCH_SIZE per HTTP call."""
+        results: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+
+        for start in range(0, len(entries), self.BATCH_SIZE):
+            group = entries[start : start + self.BATCH_SIZE]
+
+            def on_response(request_id, response, exception, group=group):
+                key = group[int(request_id)]
+                if exception is not None:
+                    logger.warning(f"Error searching for {key[0]}: {exception}")
+                    results[key] = None
+                    return
+                files = response.get("files", [])
+                results[key] = files[0] if files else None
+
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for i, (name, parent_id) in enumerate(group):
+                batch.add(
+                    self.service.files().list(
+                        q=_child_query(name, parent_id, filters),
+                        spaces="drive",
+                        fields=fields,
+                        pageSize=1,
+                    ),
+                    request_id=str(i),
+                )
+            batch.execute()
+
+        return results
+
+    def _prefetch_folders(self, folder_paths: List[Tuple[str, ...]]) -> None:
+        """Resolve many folder paths with batched lookups.
+
+        Folders are resolved one depth level at a time (a child's query needs
+        its parent's ID): each level's unknown folders are looked up in
+        batches, missing ones are created, and all IDs land in _folder_cache
+        so later _resolve_folder() calls make no requests.
+        """
+        paths = {path[:depth] for path in folder_paths for depth in range(1, len(path) + 1)}
+        ids: Dict[Tuple[str, ...], str] = {(): self.folder_id}
+
+        for depth in range(1, max(map(len, paths), default=0) + 1):
+            level = sorted(path for path in paths if len(path) == depth)
+            keys = {path: (path[-1], ids[path[:-1]]) for path in level}
+            unknown = [key for key in keys.values() if key not in self._folder_cache]
+            found = self.find_remote_folders(unknown)
+
+            for path, (name, parent_id) in keys.items():
+                if (name, parent_id) not in self._folder_cache:
+                    match = found.get((name, parent_id))
+                    self._folder_cache[(name, parent_id)] = (
+                        match["id"] if match else self._create_folder(name, parent_id)
+                    )
+                ids[path] = self._folder_cache[(name, parent_id)]
+
     def ensure_folder_exists(self, folder_name: str, parent_id: str) -> str:
         """Create folder if it doesn't exist.
 
+        Results are memoized per (folder_name, parent_id), so walking the same
+        hierarchy for many files costs one lookup per distinct folder.
+
         Returns:
             Folder ID
         """
+        cache_key = (folder_name, parent_id)
+        cached = self._folder_cache.get(cache_key)
+        if cached:
+            return cached
+
         try:
             # Check if folder exists
             results = (
                 self.service.files()
                 .list(
-                    q=f"name='{folder_name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false",
+                    q=_child_query(folder_name, parent_id, FOLDER_FILTER),
                     spaces="drive",
                     fields="files(id)",
                     pageSize=1,
@@ -177,24 +454,35 @@ class GoogleDriveConnector:
             files = results.get("files", [])
 
             if files:
+                self._folder_cache[cache_key] = files[0]["id"]
                 return files[0]["id"]
 
-            # Create new folder
-            logger.debug(f"Creating folder: {folder_name}")
-            file_metadata = {
-                "name": folder_name,
-                "mimeType": "application/vnd.google-apps.folder",
-                "parents": [parent_id],
-            }
-            folder = self.service.files().create(body=file_metadata, fields="id").execute()
-            return folder["id"]
+            folder_id = self._create_folder(folder_name, parent_id)
+            self._folder_cache[cache_key] = folder_id
+            return folder_id
 
         except HttpError as e:
             logger.error(f"Error managing folder: {e}")
             raise
 
+    def _create_folder(self, folder_name: str, parent_id: str) -> str:
+        """Create a folder and return its ID."""
+        logger.debug("Creating folder: %s", folder_name)
+        file_metadata = {
+            "name": folder_name,
+            "mimeType": "application/vnd.google-apps.folder",
+            "parents": [parent_id],
+        }
+        folder = self.service.files().create(body=file_metadata, fields="id").execute()
+        return folder["id"]
+
     def upload_file(
-        self, file_path: Path, remote_path: str, dry_run: bool = False
+        self,
+        file_path: Path,
+        remote_path: str,
+        dry_run: bool = False,
+        existing_index: Optional[Dict[str, Dict[str, Any]]] = None,
+        size: Optional[int] = None,
     ) -> Optional[str]:
         """Upload file to Google Drive.
 
@@ -202,6 +490,9 @@ class GoogleDriveConnector:
             file_path: Local file path
             remote_path: Remote path (e.g., "market_data/b3_cotahist/file.parquet")
             dry_run: If True, only show what would be uploaded
+            existing_index: Optional list_folder_children() result for the
+                target folder; replaces the per-file existence query
+            size: File size if the caller already stat'ed it
 
         Returns:
             File ID if uploaded, None if skipped
@@ -217,18 +508,14 @@ class GoogleDriveConnector:
             # Parse remote path
             parts = remote_path.split("/")
             file_name = parts[-1]
-            folder_parts = parts[:-1]
-
-            # Navigate/create folder hierarchy
-            current_folder_id = self.folder_id
-            for folder_name in folder_parts:
-                current_folder_id = self.ensure_folder_exists(folder_name, current_folder_id)
-
-            file_size = file_path.stat().st_size
-            file_hash = self.get_file_hash(file_path)
+            parent_id = self._resolve_folder(parts[:-1])
 
             # Check if file exists remotely
-            existing_file_id = self.find_remote_file(file_name, current_folder_id)
+            if existing_index is not None:
+                existing = existing_index.get(file_name)
+                existing_file_id = existing["id"] if existing else None
+            else:
+                existing_file_id = self.find_remote_file(file_name, parent_id)
 
             if existing_file_id:
                 logger.info(
@@ -237,48 +524,119 @@ class GoogleDriveConnector:
                 # Could check hash here to determine if update needed
                 return existing_file_id
 
-            if dry_run:
-                logger.info(f"[DRY-RUN] Would upload: {remote_path} ({file_size / 1024 / 1024:.2f} MB)")
-                return None
+            return self._create_file(
+                file_path, remote_path, parent_id, dry_run=dry_run, size=size
+            )
 
-            logger.info(f"Uploading: {remote_path} ({file_size / 1024 / 1024:.2f} MB)")
+        except Exception as e:
+            logger.error(f"Upload failed for {remote_path}: {e}")
+            return None
 
-            file_metadata = {
-                "name": file_name,
-                "parents": [current_folder_id],
-                "properties": {
-                    "local_path": str(file_path),
-                    "hash_sha256": file_hash,
-                    "uploaded_at": datetime.now().isoformat(),
-                },
-            }
+    def _resolve_folder(self, folder_parts: List[str]) -> str:
+        """Navigate/create a folder hierarchy below the root folder.
 
-            media = MediaFileUpload(str(file_path), resumable=True, chunksize=self.CHUNK_SIZE)
-            request = self.service.files().create(
-                body=file_metadata, media_body=media, fields="id, webViewLink"
-            )
+        Returns:
+            ID of the innermost folder
+        """
+        current_folder_id = self.folder_id
+        for folder_name in folder_parts:
+            current_folder_id = self.ensure_folder_exists(folder_name, current_folder_id)
+        return current_folder_id
 
-            response = None
-            while response is None:
-                status, response = request.next_chunk()
-                if status:
-                    progress = int(status.progress() * 100)
-                    logger.debug(f"Upload progress: {progress}%")
+    def _chunk_size(self, file_size: int) -> int:
+        """Pick the resumable chunk size for a file.
 
-            file_id = response["id"]
-            logger.info(f"✓ Uploaded: {remote_path} (ID: {file_id})")
-            return file_id
+        Files up to SINGLE_PUT_LIMIT are streamed in a single request
+        (chunksize=-1); larger ones use CHUNK_SIZE chunks, so a failed chunk
+        costs at most CHUNK_SIZE of re-upload.
+        """
+        return -1 if file_size < self.SINGLE_PUT_LIMIT else self.CHUNK_SIZE
 
-        except Exception as e:
-            logger.error(f"Upload failed for {remote_path}: {e}")
+    def _create_file(
+        self,
+        file_path: Path,
+        remote_path: str,
+        parent_id: str,
+        dry_run: bool = False,
+        service=None,
+        size: Optional[int] = None,
+    ) -> Optional[str]:
+        """Upload a file known not to exist remotely.
+
+        Args:
+            service: Drive service to use (defaults to self.service)
+            size: File size if the caller already stat'ed it
+
+        Returns:
+            File ID if uploaded, None on dry-run
+        """
+        service = service or self.service
+        file_name = remote_path.split("/")[-1]
+        file_size = file_path.stat().st_size if size is None else size
+
+        if dry_run:
+            logger.info(
+                "[DRY-RUN] Would upload: %s (%.2f MB)", remote_path, file_size / 1024 / 1024
+            )
             return None
 
+        logger.info("Uploading: %s (%.2f MB)", remote_path, file_size / 1024 / 1024)
+
+        hash_property = f"hash_{self.HASH_ALGORITHM}"
+        file_metadata = {
+            "name": file_name,
+            "parents": [parent_id],
+            "properties": {
+                "local_path": str(file_path),
+                "uploaded_at": datetime.now().isoformat(),
+            },
+        }
+
+        if file_size < self.RESUMABLE_THRESHOLD:
+            # Single multipart request: no resumable session or per-chunk
+            # round-trips. Small files are hashed up front (the upload then
+            # re-reads them from page cache) so the hash goes in the same call.
+            file_metadata["properties"][hash_property] = self.get_file_hash(file_path)
+            media = MediaFileUpload(str(file_path), resumable=False)
+            response = service.files().create(
+                body=file_metadata, media_body=media, fields="id, webViewLink"
+            ).execute()
+        else:
+            # Large files are hashed while they stream, in one pass over the
+            # bytes; the hash is attached afterwards with a metadata update
+            mimetype = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+            with _HashingReader(file_path, self._new_hasher()) as reader:
+                media = MediaIoBaseUpload(
+                    reader, mimetype, chunksize=self._chunk_size(file_size), resumable=True
+                )
+                request = service.files().create(
+                    body=file_metadata, media_body=media, fields="id, webViewLink"
+                )
+
+                response = None
+                while response is None:
+                    status, response = request.next_chunk()
+                    if status:
+                        progress = int(status.progress() * 100)
+                        logger.debug("Upload progress: %s%%", progress)
+
+                file_hash = reader.hexdigest()
+
+            service.files().update(
+                fileId=response["id"], body={"properties": {hash_property: file_hash}}
+            ).execute()
+
+        file_id = response["id"]
+        logger.info("✓ Uploaded: %s (ID: %s)", remote_path, file_id)
+        return file_id
+
     def sync_directory(
         self,
         local_dir: Path,
         remote_prefix: str = "",
         dry_run: bool = False,
         pattern: str = "*.parquet",
+        manifest_path: Optional[Path] = None,
     ) -> Dict[str, Any]:
         """Recursively sync directory to Google Drive.
 
@@ -287,9 +645,12 @@ class GoogleDriveConnector:
             remote_prefix: Remote folder path prefix
             dry_run: If True, only show what would be synced
             pattern: File pattern to sync (e.g., "*.parquet")
+            manifest_path: Optional local sync manifest. Files whose mtime and
+                size match their manifest entry are skipped without querying Drive.
 
         Returns:
-            Sync statistics
+            Sync statistics; a dry run also maps each would-be-uploaded remote
+            path to its content hash under "hashes"
         """
         if not self.is_authenticated():
             raise RuntimeError("Not authenticated with Google Drive")
@@ -299,43 +660,190 @@ class GoogleDriveConnector:
             return {"uploaded": 0, "skipped": 0, "errors": 0, "total_size": 0}
 
         stats = {"uploaded": 0, "skipped": 0, "errors": 0, "total_size": 0, "files": []}
+        manifest = self._load_sync_manifest(manifest_path) if manifest_path else {}
 
-        # Find all files matching pattern
-        files = list(local_dir.rglob(pattern))
-        logger.info(f"Found {len(files)} files to sync")
+        # Find all files matching pattern; the stat is taken once here and
+        # reused for the manifest check, stats and uploads
+        files = list(_scan_matching(os.fspath(local_dir), pattern))
+        logger.info("Found %s files to sync", len(files))
 
-        for file_path in files:
+        # Resolve remote locations first so existence checks can be batched
+        changed = []
+        for path_str, file_stat in files:
+            file_path = Path(path_str)
             try:
-                # Calculate relative path
                 rel_path = file_path.relative_to(local_dir)
                 remote_path = str(Path(remote_prefix) / rel_path).replace("\\", "/")
 
-                file_id = self.upload_file(file_path, remote_path, dry_run=dry_run)
-
-                if file_id:
-                    stats["uploaded"] += 1
-                    stats["files"].append(
-                        {
-                            "name": str(rel_path),
-                            "size": file_path.stat().st_size,
-                            "file_id": file_id,
-                        }
-                    )
-                else:
+                entry = manifest.get(remote_path)
+                if (
+                    entry
+                    and entry["mtime_ns"] == file_stat.st_mtime_ns
+                    and entry["size"] == file_stat.st_size
+                ):
+                    logger.debug("Unchanged since last sync: %s", remote_path)
                     stats["skipped"] += 1
+                    stats["total_size"] += file_stat.st_size
+                    continue
 
-                stats["total_size"] += file_path.stat().st_size
+                changed.append((file_path, rel_path, remote_path, file_stat))
+            except Exception as e:
+                logger.error(f"Error syncing {file_path}: {e}")
+                stats["errors"] += 1
+
+        # Look up/create every needed folder in batched rounds up front; on
+        # failure the per-file resolution below retries and reports errors
+        try:
+            self._prefetch_folders(
+                list({tuple(remote_path.split("/")[:-1]) for _, _, remote_path, _ in changed})
+            )
+        except Exception as e:
+            logger.warning(f"Batched folder lookup failed, resolving per file: {e}")
 
+        planned = []
+        for file_path, rel_path, remote_path, file_stat in changed:
+            try:
+                parent_id = self._resolve_folder(remote_path.split("/")[:-1])
+                planned.append((file_path, rel_path, remote_path, parent_id, file_stat))
             except Exception as e:
                 logger.error(f"Error syncing {file_path}: {e}")
                 stats["errors"] += 1
 
+        # One paged children listing per target folder; folders whose listing
+        # fails fall back to batched per-file queries
+        remote_files: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        fallback = []
+        for parent_id in {parent_id for _, _, _, parent_id, _ in planned}:
+            try:
+                children = self.list_folder_children(parent_id)
+            except Exception as e:
+                logger.warning(f"Error listing folder {parent_id}: {e}")
+                fallback.extend(
+                    (file_path.name, parent_id)
+                    for file_path, _, _, item_parent, _ in planned
+                    if item_parent == parent_id
+                )
+                continue
+            remote_files.update(
+                ((name, parent_id), remote_file) for name, remote_file in children.items()
+            )
+        if fallback:
+            remote_files.update(self.find_remote_files(fallback))
+
+        def record(file_path, rel_path, remote_path, file_stat, synced_id, file_id):
+            file_size = file_stat.st_size
+            if synced_id:
+                manifest[remote_path] = {
+                    "mtime_ns": file_stat.st_mtime_ns,
+                    "size": file_size,
+                    "file_id": synced_id,
+                }
+
+            if file_id:
+                stats["uploaded"] += 1
+                stats["files"].append(
+                    {
+                        "name": str(rel_path),
+                        "size": file_size,
+                        "file_id": file_id,
+                    }
+                )
+            else:
+                stats["skipped"] += 1
+
+            stats["total_size"] += file_size
+
+        to_upload = []
+        for item in planned:
+            file_path, rel_path, remote_path, parent_id, file_stat = item
+            existing = remote_files.get((file_path.name, parent_id))
+            if existing:
+                logger.info("File exists remotely: %s (ID: %s)", remote_path, existing["id"])
+                record(file_path, rel_path, remote_path, file_stat, existing["id"], None)
+            else:
+                to_upload.append(item)
+
+        # Hash + upload concurrently so GIL-free hashing and network waits
+        # overlap, with one Drive service per worker thread (httplib2 isn't
+        # thread-safe). A dry run only hashes (reported in stats["hashes"]),
+        # so it needs no service at all; without stored credentials (e.g. an
+        # injected service) uploads are serial.
+        per_thread_service = self._credentials is not None and not dry_run
+        workers = self.UPLOAD_WORKERS if per_thread_service or dry_run else 1
+        uploaded_bytes = 0
+        started = time.monotonic()
+        if dry_run:
+            stats["hashes"] = {}
+
+        def upload(item):
+            file_path, _, remote_path, parent_id, file_stat = item
+            if dry_run:
+                digest = self.get_file_hash(file_path)
+                stats["hashes"][remote_path] = digest
+                logger.info(
+                    f"[DRY-RUN] Would upload: {remote_path} "
+                    f"({file_stat.st_size / 1024 / 1024:.2f} MB, {self.HASH_ALGORITHM} {digest})"
+                )
+                return None
+            service = self._get_thread_service() if per_thread_service else self.service
+            return self._create_file(
+                file_path,
+                remote_path,
+                parent_id,
+                dry_run=dry_run,
+                service=service,
+                size=file_stat.st_size,
+            )
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Largest files first: Drive has no server-side compose to split one
+            # file across streams, so the best fill of the pipe is to start the
+            # long uploads early and let small files pack around them
+            to_upload.sort(key=lambda item: item[4].st_size, reverse=True)
+            futures = {pool.submit(upload, item): item for item in to_upload}
+            for future in as_completed(futures):
+                file_path, rel_path, remote_path, _, file_stat = futures[future]
+                try:
+                    file_id = future.result()
+                except Exception as e:
+                    logger.error(f"Error syncing {file_path}: {e}")
+                    stats["errors"] += 1
+                    continue
+                if file_id:
+                    uploaded_bytes += file_stat.st_size
+                record(file_path, rel_path, remote_path, file_stat, file_id, file_id)
+
+        elapsed = time.monotonic() - started
+        stats["throughput_mbps"] = (
+            uploaded_bytes * 8 / 1_000_000 / elapsed if uploaded_bytes and elapsed else 0.0
+        )
+
+        if manifest_path and not dry_run:
+            self._save_sync_manifest(manifest_path, manifest)
+
         logger.info(
             f"Sync complete: {stats['uploaded']} uploaded, "
             f"{stats['skipped']} skipped, {stats['errors']} errors"
         )
         return stats
 
+    @staticmethod
+    def _load_sync_manifest(manifest_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Load the local sync manifest (remote path -> mtime_ns, size, file_id)."""
+        if not manifest_path.exists():
+            return {}
+        try:
+            return orjson.loads(manifest_path.read_bytes())
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"Ignoring corrupt sync manifest {manifest_path}: {e}")
+            return {}
+
+    @staticmethod
+    def _save_sync_manifest(manifest_path: Path, manifest: Dict[str, Dict[str, Any]]) -> None:
+        """Persist the local sync manifest."""
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_bytes(orjson.dumps(manifest))
+
     def list_remote_files(self, folder_id: Optional[str] = None) -> list:
         """List files in remote folder."""
         if not self.is_authenticated():
@@ -346,7 +854,7 @@ class GoogleDriveConnector:
             results = (
                 self.service.files()
                 .list(
-                    q=f"'{folder_id}' in parents and trashed=false",
+                    q=f"'{_escape_query(folder_id)}' in parents and trashed=false",
                     spaces="drive",
                     fields="files(id, name, mimeType, size, modifiedTime)",
                     pageSize=1000,
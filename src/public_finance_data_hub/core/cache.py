@@ -3,19 +3,29 @@ Cache Module
 
 Sistema de cache para reduzir requisições à API com:
 - TTL (Time To Live) configurável
-- Armazenamento em arquivo JSON
+- Armazenamento em arquivo binário MessagePack (msgspec)
 - Verificação de cache antes de requisições
 """
 
-import json
-import hashlib
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+import msgspec
+import orjson
+import xxhash
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional, Any, Dict
+from datetime import timedelta
+from typing import Optional, Any, Dict, Iterator, Tuple
 
 logger = logging.getLogger(__name__)
 
+CACHE_SUFFIX = '.msgpack'
+
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
 
 class APICache:
     """Cache para respostas de APIs com suporte a TTL"""
@@ -24,18 +34,46 @@ class APICache:
         self,
         cache_dir: str = './cache',
         default_ttl_hours: int = 24,
-        enabled: bool = True
+        enabled: bool = True,
+        memory_max_entries: int = 1024
     ):
         """
         Args:
             cache_dir: Diretório para armazenar cache
             default_ttl_hours: TTL padrão em horas
             enabled: Se cache está habilitado
+            memory_max_entries: Máximo de entradas na camada LRU em memória
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_ttl = timedelta(hours=default_ttl_hours)
         self.enabled = enabled
+        # Camada LRU em memória: cache_key -> (expira_em epoch, bytes msgpack).
+        # Guarda os bytes e não o objeto: cada acerto decodifica uma cópia
+        # nova, então um chamador que altere o resultado não afeta os demais
+        self._mem: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._mem_max = memory_max_entries
+        self._mem_lock = threading.Lock()
+    
+    def _mem_put(self, cache_key: str, expires_at: float, raw: bytes) -> None:
+        """Insere na camada em memória, descartando a entrada menos recente"""
+        with self._mem_lock:
+            self._mem[cache_key] = (expires_at, raw)
+            self._mem.move_to_end(cache_key)
+            if len(self._mem) > self._mem_max:
+                self._mem.popitem(last=False)
+    
+    def _mem_get(self, cache_key: str) -> Optional[bytes]:
+        """Bytes da entrada em memória se ainda válida (None se ausente/expirada)"""
+        with self._mem_lock:
+            mem_entry = self._mem.get(cache_key)
+            if mem_entry is None:
+                return None
+            if time.time() < mem_entry[0]:
+                self._mem.move_to_end(cache_key)
+                return mem_entry[1]
+            self._mem.pop(cache_key, None)
+            return None
     
     def _get_cache_key(self, url: str, params: Optional[Dict] = None) -> str:
         """
@@ -48,13 +86,19 @@ class APICache:
         Returns:
             str: Chave de cache em hex
         """
-        params_str = json.dumps(params, sort_keys=True) if params else '{}'
-        full_string = f"{url}:{params_str}"
-        return hashlib.md5(full_string.encode()).hexdigest()
+        if not params:
+            # Caso comum: sem parâmetros, evita serializar
+            return xxhash.xxh3_128_hexdigest(url.encode())
+        # Forma canônica estável: chaves ordenadas, direto em bytes
+        canonical = orjson.dumps(
+            (url, params), option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        return xxhash.xxh3_128_hexdigest(canonical)
     
     def _get_cache_file(self, cache_key: str) -> Path:
-        """Retorna path do arquivo de cache"""
-        return self.cache_dir / f"{cache_key}.json"
+        """Retorna path do arquivo de cache (particionado por prefixo da chave)"""
+        # 256 subdiretórios (2 primeiros hex da chave) para evitar diretórios enormes
+        return self.cache_dir / cache_key[:2] / f"{cache_key}{CACHE_SUFFIX}"
     
     def get(self, url: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """
@@ -71,23 +115,31 @@ class APICache:
             return None
         
         cache_key = self._get_cache_key(url, params)
+        
+        # Camada em memória: sem syscalls para consultas repetidas
+        raw = self._mem_get(cache_key)
+        if raw is not None:
+            logger.debug(f"Cache hit (memória): {url}")
+            return _decoder.decode(raw)['data']
+        
         cache_file = self._get_cache_file(cache_key)
         
-        if not cache_file.exists():
+        try:
+            mtime = cache_file.stat().st_mtime
+        except FileNotFoundError:
             logger.debug(f"Cache miss: {url}")
             return None
         
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            # Verificar se cache expirou
-            created_at = datetime.fromisoformat(cache_data['_created_at'])
-            if datetime.now() - created_at > self.default_ttl:
+            # Verificar expiração pelo mtime, sem ler o conteúdo do arquivo
+            if time.time() - mtime > self.default_ttl.total_seconds():
                 logger.debug(f"Cache expirado: {url}")
                 cache_file.unlink()  # Remover arquivo expirado
                 return None
             
+            raw = cache_file.read_bytes()
+            cache_data = _decoder.decode(raw)
+            self._mem_put(cache_key, mtime + self.default_ttl.total_seconds(), raw)
             logger.debug(f"Cache hit: {url}")
             return cache_data['data']
         
@@ -115,14 +167,21 @@ class APICache:
         
         try:
             cache_data = {
-                '_created_at': datetime.now().isoformat(),
                 '_url': url,
                 '_params': params,
                 'data': data
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            raw = _encoder.encode(cache_data)
+            cache_file.parent.mkdir(exist_ok=True)
+            # Escrita atômica (tmp único + rename): leitores concorrentes nunca
+            # veem um arquivo pela metade
+            tmp_file = cache_file.with_name(
+                f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            tmp_file.write_bytes(raw)
+            os.replace(tmp_file, cache_file)
+            self._mem_put(cache_key, time.time() + self.default_ttl.total_seconds(), raw)
             
             logger.debug(f"Cache saved: {url}")
             return True
@@ -131,6 +190,17 @@ class APICache:
             logger.error(f"Erro ao salvar cache {cache_file}: {e}")
             return False
     
+    def _iter_entries(self) -> Iterator[os.DirEntry]:
+        """Itera arquivos de cache via os.scandir (stat em cache no DirEntry)"""
+        with os.scandir(self.cache_dir) as it:
+            for shard in it:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as shard_it:
+                    for entry in shard_it:
+                        if entry.name.endswith(CACHE_SUFFIX) and entry.is_file():
+                            yield entry
+    
     def clear(self, older_than_hours: Optional[int] = None) -> int:
         """
         Limpa cache antigo
@@ -144,33 +214,36 @@ class APICache:
         """
         deleted = 0
         cutoff_time = None
+        with self._mem_lock:
+            self._mem.clear()
         
         if older_than_hours:
-            cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
+            cutoff_time = time.time() - older_than_hours * 3600
         
-        for cache_file in self.cache_dir.glob('*.json'):
-            if cutoff_time:
-                file_time = datetime.fromtimestamp(cache_file.stat().st_mtime)
-                if file_time > cutoff_time:
-                    continue
+        for entry in self._iter_entries():
+            if cutoff_time and entry.stat().st_mtime > cutoff_time:
+                continue
             
             try:
-                cache_file.unlink()
+                os.unlink(entry.path)
                 deleted += 1
-                logger.debug(f"Cache deletado: {cache_file}")
+                logger.debug(f"Cache deletado: {entry.path}")
             except Exception as e:
-                logger.warning(f"Erro ao deletar {cache_file}: {e}")
+                logger.warning(f"Erro ao deletar {entry.path}: {e}")
         
         logger.info(f"Total de arquivos de cache deletados: {deleted}")
         return deleted
     
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas do cache"""
-        cache_files = list(self.cache_dir.glob('*.json'))
-        total_size = sum(f.stat().st_size for f in cache_files)
+        total_files = 0
+        total_size = 0
+        for entry in self._iter_entries():
+            total_files += 1
+            total_size += entry.stat().st_size
         
         return {
-            'total_files': len(cache_files),
+            'total_files': total_files,
             'total_size_mb': total_size / (1024 * 1024),
             'cache_dir': str(self.cache_dir),
             'enabled': self.enabled,
@@ -8,13 +8,21 @@ Cliente HTTP com:
 - Retry automático
 """
 
+import atexit
+import itertools
 import logging
+import threading
+import httpx
+import orjson
 import requests
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlsplit
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import random
 
+from public_finance_data_hub.core.rate_limiter import RequestRateLimiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,54 +52,144 @@ class UserAgentRotator:
         'Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Mobile/15E148 Safari/604.1',
     ]
     
+    # Ordem embaralhada uma vez; cada chamada só avança o ciclo
+    _cycle = itertools.cycle(random.sample(USER_AGENTS, len(USER_AGENTS)))
+    _lock = threading.Lock()
+    
     @staticmethod
     def get_random() -> str:
-        """Retorna User-Agent aleatório"""
-        return random.choice(UserAgentRotator.USER_AGENTS)
+        """Retorna o próximo User-Agent da rotação"""
+        with UserAgentRotator._lock:
+            return next(UserAgentRotator._cycle)
 
 
-class HTTPClient:
-    """Cliente HTTP com proteções integradas"""
-    
-    def __init__(
-        self,
-        timeout: int = 30,
-        max_retries: int = 3,
-        backoff_factor: float = 0.3,
-    ):
-        """
-        Args:
-            timeout: Timeout em segundos
-            max_retries: Tentativas máximas
-            backoff_factor: Fator de backoff exponencial
-        """
-        self.timeout = timeout
-        self.session = self._create_session(max_retries, backoff_factor)
+# Sobrescritas do POST sobre os headers da sessão (None remove o header)
+POST_HEADERS = {'Accept': 'application/json', 'Referer': None}
+
+
+def _with_user_agent(headers: Optional[Dict], base: Optional[Dict] = None) -> Dict:
+    """
+    Headers da requisição: base + headers do chamador + User-Agent rotativo
     
+    Os padrões ficam em session.headers; aqui só se monta o que muda por
+    requisição, sem alterar o dict do chamador.
+    """
+    merged = {**(base or {}), **(headers or {})}
+    if 'User-Agent' not in merged:
+        merged['User-Agent'] = UserAgentRotator.get_random()
+    return merged
+
+
+class SessionRegistry:
+    """Sessões HTTP compartilhadas por host
+
+    Uma sessão (e um pool de conexões keep-alive) por hostname e
+    configuração de retry, reaproveitada por todos os HTTPClient do
+    processo, evitando um handshake TCP+TLS novo a cada cliente.
+    """
+
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 50
+
+    DEFAULT_HEADERS = {
+        'Accept': 'application/json, text/plain, */*',
+        'Accept-Language': 'pt-BR,pt;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Referer': 'https://www.google.com/',
+    }
+
+    _sessions: Dict[Tuple[str, int, float], requests.Session] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(
+        cls,
+        url: str,
+        max_retries: int,
+        backoff_factor: float
+    ) -> requests.Session:
+        """Retorna a sessão do host de `url`, criando-a se necessário"""
+        key = (urlsplit(url).netloc, max_retries, backoff_factor)
+        session = cls._sessions.get(key)
+        if session is None:
+            with cls._lock:
+                session = cls._sessions.get(key)
+                if session is None:
+                    session = cls._create_session(max_retries, backoff_factor)
+                    cls._sessions[key] = session
+        return session
+
+    @classmethod
     def _create_session(
-        self,
+        cls,
         max_retries: int,
         backoff_factor: float
     ) -> requests.Session:
         """
-        Cria sessão com retry automático
+        Cria sessão com retry automático e pool de conexões dimensionado
         """
         session = requests.Session()
+        session.headers.update(cls.DEFAULT_HEADERS)
         
         # Configura retry
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
+            # 429 fica fora: sobe para ExponentialBackoffRetry, que respeita
+            # o Retry-After, e o RequestRateLimiter pausa via observe()
+            status_forcelist=[500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST"]
         )
         
         # Monta adaptador
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            pool_block=False,
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Fecha todas as sessões (executado na saída do processo)"""
+        with cls._lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+
+
+atexit.register(SessionRegistry.close_all)
+
+
+class HTTPClient:
+    """Cliente HTTP com proteções integradas"""
+    
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        rate_limiter: Optional[RequestRateLimiter] = None,
+    ):
+        """
+        Args:
+            timeout: Timeout em segundos
+            max_retries: Tentativas máximas
+            backoff_factor: Fator de backoff exponencial
+            rate_limiter: Limitador informado dos headers de quota (opcional)
+        """
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.rate_limiter = rate_limiter
+    
+    def _session_for(self, url: str) -> requests.Session:
+        """Sessão compartilhada do host de `url`"""
+        return SessionRegistry.get(url, self.max_retries, self.backoff_factor)
     
     def get(
         self,
@@ -102,29 +200,22 @@ class HTTPClient:
     ) -> requests.Response:
         """
         GET request com User-Agent aleatório
+
+        Os headers padrão já estão na sessão; aqui só entra o User-Agent.
         """
-        if headers is None:
-            headers = {}
+        headers = _with_user_agent(headers)
+        logger.debug("GET %s com headers: %s", url, headers)
         
-        # Adiciona User-Agent se não fornecido
-        if 'User-Agent' not in headers:
-            headers['User-Agent'] = UserAgentRotator.get_random()
-        
-        # Adiciona headers padrão
-        headers.setdefault('Accept', 'application/json, text/plain, */*')
-        headers.setdefault('Accept-Language', 'pt-BR,pt;q=0.9,en;q=0.8')
-        headers.setdefault('Accept-Encoding', 'gzip, deflate, br')
-        headers.setdefault('Referer', 'https://www.google.com/')
-        
-        logger.debug(f"GET {url} com headers: {headers}")
-        
-        return self.session.get(
+        response = self._session_for(url).get(
             url,
             params=params,
             headers=headers,
             timeout=self.timeout,
             **kwargs
         )
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(response)
+        return response
     
     def post(
         self,
@@ -137,18 +228,10 @@ class HTTPClient:
         """
         POST request com User-Agent aleatório
         """
-        if headers is None:
-            headers = {}
-        
-        if 'User-Agent' not in headers:
-            headers['User-Agent'] = UserAgentRotator.get_random()
-        
-        headers.setdefault('Accept', 'application/json')
-        headers.setdefault('Accept-Language', 'pt-BR,pt;q=0.9,en;q=0.8')
-        
-        logger.debug(f"POST {url} com headers: {headers}")
+        headers = _with_user_agent(headers, POST_HEADERS)
+        logger.debug("POST %s com headers: %s", url, headers)
         
-        return self.session.post(
+        response = self._session_for(url).post(
             url,
             json=json,
             data=data,
@@ -156,6 +239,9 @@ class HTTPClient:
             timeout=self.timeout,
             **kwargs
         )
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(response)
+        return response
     
     def get_json(
         self,
@@ -172,11 +258,10 @@ class HTTPClient:
         """
         response = self.get(url, params=params, headers=headers, **kwargs)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
     
     def close(self):
-        """Fecha a sessão"""
-        self.session.close()
+        """Nada a fechar: as sessões são compartilhadas no SessionRegistry"""
     
     def __enter__(self):
         return self
@@ -185,29 +270,96 @@ class HTTPClient:
         self.close()
 
 
-def create_bcb_client() -> HTTPClient:
-    """Cria cliente HTTP para BCB"""
-    return HTTPClient(timeout=30, max_retries=3)
-
-
-def create_fred_client() -> HTTPClient:
-    """Cria cliente HTTP para FRED"""
-    return HTTPClient(timeout=30, max_retries=3)
+class AsyncHTTPClient:
+    """Cliente HTTP assíncrono (httpx, HTTP/2) com User-Agents rotativos
 
+    Um único AsyncClient com pool de conexões keep-alive, para que várias
+    requisições ao mesmo host fiquem em voo ao mesmo tempo.
+    """
+    
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        rate_limiter: Optional[RequestRateLimiter] = None,
+    ):
+        """
+        Args:
+            timeout: Timeout em segundos
+            max_connections: Conexões simultâneas máximas
+            max_keepalive_connections: Conexões ociosas mantidas no pool
+            rate_limiter: Limitador informado dos headers de quota (opcional)
+        """
+        self.rate_limiter = rate_limiter
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+            http2=True,
+            headers=SessionRegistry.DEFAULT_HEADERS,
+        )
+    
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        GET request com User-Agent aleatório
+        """
+        headers = _with_user_agent(headers)
+        logger.debug("GET %s com headers: %s", url, headers)
+        
+        response = await self.client.get(url, params=params, headers=headers, **kwargs)
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(response)
+        return response
+    
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        **kwargs
+    ) -> Dict:
+        """
+        GET request que retorna JSON automaticamente
+        
+        Raises:
+            httpx.HTTPStatusError: Se status_code >= 400
+        """
+        response = await self.get(url, params=params, headers=headers, **kwargs)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def aclose(self):
+        """Fecha o cliente e suas conexões"""
+        await self.client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *args):
+        await self.aclose()
 
-def create_anbima_client() -> HTTPClient:
-    """Cria cliente HTTP para Anbima"""
-    return HTTPClient(timeout=30, max_retries=3)
 
+# Hosts mais restritivos recebem mais tentativas
+RESTRICTED_HOSTS = ('yahoo.com', 'b3.com.br')
 
-def create_yahoo_client() -> HTTPClient:
-    """Cria cliente HTTP para Yahoo (mais restritivo)"""
-    return HTTPClient(timeout=30, max_retries=5)
 
+def get_client_for(url: str, timeout: int = 30) -> HTTPClient:
+    """Cria cliente HTTP adequado à fonte de `url`
 
-def create_b3_client() -> HTTPClient:
-    """Cria cliente HTTP para B3 (mais restritivo)"""
-    return HTTPClient(timeout=30, max_retries=5)
+    Clientes do mesmo host compartilham a sessão via SessionRegistry.
+    """
+    host = urlsplit(url).hostname or ''
+    restricted = any(host == h or host.endswith('.' + h) for h in RESTRICTED_HOSTS)
+    return HTTPClient(timeout=timeout, max_retries=5 if restricted else 3)
 
 
 # Instâncias globais
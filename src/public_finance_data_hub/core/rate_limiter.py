@@ -7,33 +7,130 @@ Implementa proteção contra rate limiting de APIs com:
 - Delays aleatórios entre requisições
 """
 
+import asyncio
+import threading
 import time
 import logging
 from collections import deque
 from datetime import datetime, timedelta
-from typing import Optional, Callable
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Callable, Tuple
 import random
 
 logger = logging.getLogger(__name__)
 
+# Headers de quota dos provedores (o primeiro presente vence)
+REMAINING_HEADERS = (
+    'X-RateLimit-Remaining',
+    'X-RateLimit-Remaining-Requests',
+    'RateLimit-Remaining',
+)
+LIMIT_HEADERS = ('X-RateLimit-Limit', 'X-RateLimit-Limit-Requests', 'RateLimit-Limit')
+RESET_HEADERS = ('X-RateLimit-Reset', 'X-RateLimit-Reset-Requests', 'RateLimit-Reset')
+
+# A partir desta taxa (req/min) o rate limiter é dispensado
+UNLIMITED_RPM = 1_000_000
+
+# Pausa quando restam menos que esta fração da quota
+LOW_QUOTA_RATIO = 0.10
+
+# Intervalo entre tentativas de pegar o RetryGate no caminho assíncrono
+RETRY_GATE_POLL_SECONDS = 0.05
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Converte um Retry-After (segundos ou HTTP-date) em segundos de espera
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _header_float(headers: Any, names) -> Optional[float]:
+    """Primeiro header numérico presente dentre `names`"""
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def retry_after_from(exc: BaseException) -> Optional[float]:
+    """Retry-After da resposta anexada a uma exceção HTTP, se houver"""
+    response = getattr(exc, 'response', None)
+    if response is None:
+        return None
+    return parse_retry_after(response.headers.get('Retry-After'))
+
 
 class RequestRateLimiter:
-    """Controla taxa de requisições por janela de tempo"""
+    """Controla taxa de requisições por minuto (token bucket)
+    
+    O balde comporta max_requests_per_minute fichas e é reabastecido
+    continuamente a max_requests_per_minute/60 fichas por segundo; cada
+    requisição consome uma. A admissão é O(1), sem guardar timestamps.
+    
+    Sem ficha disponível, a requisição reserva a próxima (o saldo fica
+    negativo) e espera fora do lock, que só protege a aritmética; assim
+    threads e corrotinas compartilham o balde sem se serializar na espera.
+    """
     
     def __init__(
         self, 
         max_requests_per_minute: int = 100,
-        name: str = "APIRateLimiter"
+        name: str = "APIRateLimiter",
+        jitter_seconds: float = 0.0
     ):
         """
         Args:
             max_requests_per_minute: Máximo de requisições por minuto
             name: Nome para logging
+            jitter_seconds: Jitter aleatório máximo somado às esperas
         """
         self.max_requests = max_requests_per_minute
         self.name = name
-        self.requests = deque(maxlen=self.max_requests)
-        self.lock = None
+        self.jitter = jitter_seconds
+        self.rate = max_requests_per_minute / 60.0
+        self.cap = float(max_requests_per_minute)
+        self.tokens = self.cap
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        """Reabastece o balde com as fichas acumuladas desde a última chamada"""
+        self.tokens = min(self.cap, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+    
+    def _reserve(self) -> float:
+        """
+        Consome uma ficha (ou reserva a próxima) e retorna a espera devida
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            sleep_time = -self.tokens / self.rate
+        
+        if self.jitter:
+            sleep_time += random.uniform(0, self.jitter)
+        logger.warning(
+            f"[{self.name}] Rate limit atingido. "
+            f"Aguardando {sleep_time:.1f}s ({self.max_requests}/min)"
+        )
+        return sleep_time
     
     def wait_if_needed(self) -> float:
         """
@@ -42,30 +139,84 @@ class RequestRateLimiter:
         Returns:
             float: Tempo aguardado em segundos
         """
-        now = time.time()
+        sleep_time = self._reserve()
+        if sleep_time:
+            time.sleep(sleep_time)
+        return sleep_time
+    
+    async def async_wait_if_needed(self) -> float:
+        """
+        Versão assíncrona de wait_if_needed (espera com asyncio.sleep)
         
-        # Remove requisições antigas (>1 minuto)
-        while self.requests and self.requests[0] < now - 60:
-            self.requests.popleft()
+        O lock só cobre a reserva, microssegundos, então pode ser tomado
+        direto do event loop; o balde é o mesmo do caminho síncrono.
         
-        sleep_time = 0.0
-        if len(self.requests) >= self.max_requests:
-            sleep_time = 60 - (now - self.requests[0]) + 0.1
-            logger.warning(
-                f"[{self.name}] Rate limit atingido. "
-                f"Aguardando {sleep_time:.1f}s ({len(self.requests)}/{self.max_requests})"
+        Returns:
+            float: Tempo aguardado em segundos
+        """
+        sleep_time = self._reserve()
+        if sleep_time:
+            await asyncio.sleep(sleep_time)
+        return sleep_time
+    
+    def set_rate(self, requests_per_minute: float) -> None:
+        """Altera a taxa de reposição do balde (capacidade inalterada)"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = requests_per_minute / 60.0
+    
+    def observe(self, response: Any) -> float:
+        """
+        Ajusta o balde a partir dos headers de quota de uma resposta
+        
+        Em 429, ou quando a quota restante está abaixo de 10% (ou <= 2),
+        o balde é esvaziado e a reposição só recomeça após Retry-After
+        ou X-RateLimit-Reset, de modo que wait_if_needed segure as
+        próximas requisições em vez de deixá-las falhar.
+        
+        Args:
+            response: Resposta HTTP (requests ou httpx)
+            
+        Returns:
+            float: Pausa aplicada em segundos (0 se nenhuma)
+        """
+        headers = response.headers
+        pause = parse_retry_after(headers.get('Retry-After'))
+        
+        low_quota = response.status_code == 429
+        remaining = _header_float(headers, REMAINING_HEADERS)
+        if remaining is not None:
+            limit = _header_float(headers, LIMIT_HEADERS)
+            low_quota = low_quota or remaining <= 2 or bool(
+                limit and remaining / limit < LOW_QUOTA_RATIO
             )
-            time.sleep(sleep_time)
         
-        self.requests.append(time.time())
-        return sleep_time
+        if not low_quota:
+            return 0.0
+        
+        if pause is None:
+            reset = _header_float(headers, RESET_HEADERS)
+            if reset is not None:
+                # Alguns provedores mandam epoch, outros segundos restantes
+                pause = max(0.0, reset - time.time()) if reset > 1e9 else reset
+        pause = pause or 0.0
+        
+        with self.lock:
+            # Mantém reservas já feitas (saldo negativo)
+            self.tokens = min(self.tokens, 0.0)
+            self.last = max(self.last, time.monotonic() + pause)
+        
+        logger.warning(
+            f"[{self.name}] Quota do provedor baixa (HTTP {response.status_code}). "
+            f"Pausando {pause:.1f}s"
+        )
+        return pause
     
     def get_current_rate(self) -> float:
-        """Retorna requisições/minuto atual"""
-        now = time.time()
-        while self.requests and self.requests[0] < now - 60:
-            self.requests.popleft()
-        return len(self.requests)
+        """Retorna requisições/minuto atual (fichas consumidas do balde)"""
+        with self.lock:
+            self._refill(time.monotonic())
+            return min(self.cap, self.cap - self.tokens)
 
 
 class DelayedRequester:
@@ -94,13 +245,36 @@ class DelayedRequester:
     
     def sleep(self) -> float:
         """Aguarda delay aleatório e retorna tempo aguardado"""
+        if self.max_delay <= 0:
+            return 0.0
         delay = self.get_delay()
         logger.debug(f"[{self.name}] Aguardando {delay:.2f}s antes da requisição")
         time.sleep(delay)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
         return delay
 
 
+class RetryGate:
+    """Limita quantas chamadas podem estar em retry ao mesmo tempo por fonte
+    
+    A primeira chamada que falha sonda a recuperação; as demais que falharem
+    esperam na fila em vez de todas re-tentarem juntas (retry stampede).
+    """
+    
+    _gates: Dict[str, threading.BoundedSemaphore] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def for_key(cls, key: str, slots: int = 1) -> threading.BoundedSemaphore:
+        """Retorna o semáforo de retry compartilhado de `key`"""
+        with cls._lock:
+            gate = cls._gates.get(key)
+            if gate is None:
+                gate = threading.BoundedSemaphore(slots)
+                cls._gates[key] = gate
+            return gate
+
+
 class ExponentialBackoffRetry:
     """Implementa retry com backoff exponencial"""
     
@@ -109,19 +283,22 @@ class ExponentialBackoffRetry:
         max_retries: int = 3,
         base_delay_seconds: float = 1.0,
         max_delay_seconds: float = 60.0,
-        name: str = "ExponentialBackoff"
+        name: str = "ExponentialBackoff",
+        retry_slots: int = 1
     ):
         """
         Args:
             max_retries: Número máximo de tentativas
             base_delay_seconds: Delay base em segundos
             max_delay_seconds: Delay máximo
-            name: Nome para logging
+            name: Nome para logging (e chave do RetryGate)
+            retry_slots: Chamadas simultâneas em retry para esta fonte
         """
         self.max_retries = max_retries
         self.base_delay = base_delay_seconds
         self.max_delay = max_delay_seconds
         self.name = name
+        self.gate = RetryGate.for_key(name, retry_slots)
     
     def get_delay(self, attempt: int) -> float:
         """
@@ -156,31 +333,175 @@ class ExponentialBackoffRetry:
             
         Raises:
             Última exceção se todos os retries falharem
+        
+        A partir da primeira falha a chamada segura o RetryGate da fonte
+        (backoff + novas tentativas) até terminar, serializando os retries.
         """
         last_exception = None
+        gated = False
         
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"[{self.name}] Tentativa {attempt + 1}/{self.max_retries}")
-                return func(*args, **kwargs)
-            
-            except Exception as e:
-                last_exception = e
+        try:
+            for attempt in range(self.max_retries):
+                try:
+                    logger.debug(f"[{self.name}] Tentativa {attempt + 1}/{self.max_retries}")
+                    return func(*args, **kwargs)
                 
-                if attempt == self.max_retries - 1:
-                    logger.error(
-                        f"[{self.name}] Todas as {self.max_retries} tentativas falharam: {e}"
+                except Exception as e:
+                    last_exception = e
+                    
+                    if attempt == self.max_retries - 1:
+                        logger.error(
+                            f"[{self.name}] Todas as {self.max_retries} tentativas falharam: {e}"
+                        )
+                        raise
+                    
+                    if not gated:
+                        self.gate.acquire()
+                        gated = True
+                    
+                    delay = max(self.get_delay(attempt), retry_after_from(e) or 0.0)
+                    logger.warning(
+                        f"[{self.name}] Tentativa {attempt + 1} falhou: {e}. "
+                        f"Aguardando {delay:.1f}s antes de retry..."
                     )
-                    raise
-                
-                delay = self.get_delay(attempt)
-                logger.warning(
-                    f"[{self.name}] Tentativa {attempt + 1} falhou: {e}. "
-                    f"Aguardando {delay:.1f}s antes de retry..."
-                )
-                time.sleep(delay)
+                    time.sleep(delay)
+        finally:
+            if gated:
+                self.gate.release()
         
         raise last_exception
+    
+    async def _aacquire_gate(self) -> None:
+        """Pega o RetryGate sem bloquear o event loop nem ocupar uma thread"""
+        while not self.gate.acquire(blocking=False):
+            await asyncio.sleep(RETRY_GATE_POLL_SECONDS)
+    
+    async def aexecute_with_retry(
+        self,
+        func: Callable,
+        *args,
+        **kwargs
+    ):
+        """
+        Versão assíncrona de execute_with_retry para corrotinas
+        
+        O backoff usa asyncio.sleep, sem bloquear o event loop. O RetryGate
+        (compartilhado com o caminho síncrono) é pego com tentativas não
+        bloqueantes intercaladas com asyncio.sleep: nenhuma thread fica presa
+        esperando, e uma task cancelada na fila não chega a segurar o gate.
+        """
+        gated = False
+        
+        try:
+            for attempt in range(self.max_retries):
+                try:
+                    logger.debug(f"[{self.name}] Tentativa {attempt + 1}/{self.max_retries}")
+                    return await func(*args, **kwargs)
+                
+                except Exception as e:
+                    if attempt == self.max_retries - 1:
+                        logger.error(
+                            f"[{self.name}] Todas as {self.max_retries} tentativas falharam: {e}"
+                        )
+                        raise
+                    
+                    if not gated:
+                        await self._aacquire_gate()
+                        gated = True
+                    
+                    delay = max(self.get_delay(attempt), retry_after_from(e) or 0.0)
+                    logger.warning(
+                        f"[{self.name}] Tentativa {attempt + 1} falhou: {e}. "
+                        f"Aguardando {delay:.1f}s antes de retry..."
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            if gated:
+                self.gate.release()
+
+
+def _is_overload(exc: BaseException) -> bool:
+    """Se a exceção indica servidor sobrecarregado (429, 5xx ou conexão)"""
+    response = getattr(exc, 'response', None)
+    status = getattr(response, 'status_code', None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(exc, (OSError, TimeoutError))
+
+
+class AIMDController:
+    """Controle AIMD da taxa de requisições
+    
+    Aumento aditivo (+alpha req/min) a cada chamada rápida e bem-sucedida;
+    redução multiplicativa (*beta) em 429/5xx/falha de conexão ou quando a
+    latência passa de latency_margin * p90 das últimas chamadas.
+    
+    Cerca de 10% das chamadas saudáveis ficam acima do p90 por definição,
+    por isso a margem; e no máximo uma redução a cada `window` chamadas,
+    para uma rajada lenta não derrubar a taxa várias vezes seguidas.
+    """
+    
+    def __init__(
+        self,
+        c_max: float,
+        c_min: float = 1.0,
+        alpha: float = 0.5,
+        beta: float = 0.5,
+        window: int = 50,
+        min_samples: int = 10,
+        latency_margin: float = 2.0,
+    ):
+        """
+        Args:
+            c_max: Taxa máxima (req/min)
+            c_min: Taxa mínima (req/min)
+            alpha: Incremento aditivo por chamada saudável
+            beta: Fator multiplicativo em sobrecarga
+            window: Latências guardadas para calcular o p90; também o
+                intervalo mínimo (em chamadas) entre duas reduções
+            min_samples: Latências necessárias antes de usar o p90
+            latency_margin: Múltiplo do p90 a partir do qual a chamada é lenta
+        """
+        self.c = float(c_max)
+        self.c_min = c_min
+        self.c_max = float(c_max)
+        self.alpha = alpha
+        self.beta = beta
+        self.min_samples = min_samples
+        self.latency_margin = latency_margin
+        self.window = window
+        self.latencies = deque(maxlen=window)
+        self.since_decrease = window
+        self.lock = threading.Lock()
+    
+    def latency_target(self) -> Optional[float]:
+        """p90 das latências recentes (None com poucas amostras)"""
+        if len(self.latencies) < self.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[int(0.9 * (len(ordered) - 1))]
+    
+    def record(self, elapsed: float, error: Optional[BaseException] = None) -> float:
+        """
+        Registra uma chamada e retorna a nova taxa (req/min)
+        """
+        with self.lock:
+            target = self.latency_target()
+            if error is not None and not _is_overload(error):
+                # Erro do cliente (4xx, parse...): não diz nada sobre o servidor
+                return self.c
+            self.since_decrease += 1
+            slow = target is not None and elapsed > self.latency_margin * target
+            if error is not None or slow:
+                # Cooldown: no máximo uma redução por janela
+                if self.since_decrease >= self.window:
+                    self.c = max(self.c_min, self.c * self.beta)
+                    self.since_decrease = 0
+            else:
+                self.c = min(self.c_max, self.c + self.alpha)
+            if error is None:
+                self.latencies.append(elapsed)
+            return self.c
 
 
 class CombinedRateLimiter:
@@ -189,41 +510,145 @@ class CombinedRateLimiter:
     def __init__(
         self,
         max_requests_per_minute: int = 100,
-        min_delay_seconds: float = 1.0,
-        max_delay_seconds: float = 3.0,
+        min_delay_seconds: float = 0.0,
+        max_delay_seconds: float = 0.0,
         max_retries: int = 3,
-        name: str = "API"
+        name: str = "API",
+        jitter_seconds: float = 0.1
     ):
         """
         Args:
             max_requests_per_minute: Limite de requisições/minuto
             min_delay_seconds: Delay mínimo entre requisições
-            max_delay_seconds: Delay máximo entre requisições
+            max_delay_seconds: Delay máximo entre requisições (0 = sem
+                delay fixo; só para fontes com anti-bot agressivo)
             max_retries: Tentativas máximas em caso de erro
             name: Nome da API para logging
+            jitter_seconds: Jitter somado às esperas do rate limit
         """
         self.name = name
-        self.rate_limiter = RequestRateLimiter(max_requests_per_minute, name)
+        self.rate_limiter = RequestRateLimiter(max_requests_per_minute, name, jitter_seconds)
         self.delayer = DelayedRequester(min_delay_seconds, max_delay_seconds, name)
         self.retry = ExponentialBackoffRetry(max_retries, name=name)
+        self.aimd = AIMDController(max_requests_per_minute)
+        
+        # Configuração fixa: resolve os ramos do caminho quente uma vez
+        self._limited = max_requests_per_minute < UNLIMITED_RPM
+        self._delayed = self.delayer.max_delay > 0
     
-    def execute(self, func: Callable, *args, **kwargs):
+    def _record(self, t0: float, error: Optional[BaseException] = None) -> None:
+        """Alimenta o AIMD com uma tentativa e ajusta o rate limiter"""
+        rate = self.aimd.record(time.monotonic() - t0, error)
+        self.rate_limiter.set_rate(rate)
+    
+    def _timed(self, func: Callable) -> Callable:
+        """Envolve func medindo latência e erro de cada tentativa"""
+        def call(*args, **kwargs):
+            t0 = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._record(t0, e)
+                raise
+            self._record(t0)
+            return result
+        return call
+    
+    def _atimed(self, func: Callable) -> Callable:
+        """Versão assíncrona de _timed"""
+        async def call(*args, **kwargs):
+            t0 = time.monotonic()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self._record(t0, e)
+                raise
+            self._record(t0)
+            return result
+        return call
+    
+    def _cached(self, cache: Any, cache_key: Optional[Tuple]) -> Any:
+        """Consulta o cache antes de qualquer espera (None se ausente)"""
+        if cache is None or cache_key is None:
+            return None
+        hit = cache.get(*cache_key)
+        if hit is not None:
+            logger.debug(f"[{self.name}] Retornando do cache: {cache_key[0]}")
+        return hit
+    
+    def execute(
+        self,
+        func: Callable,
+        *args,
+        cache: Any = None,
+        cache_key: Optional[Tuple] = None,
+        **kwargs
+    ):
         """
         Executa função com todas as proteções
         
         Ordem:
-        1. Aguarda rate limit
-        2. Aguarda delay aleatório
-        3. Executa com retry automático
+        1. Consulta o cache (se informado); um acerto não consome rate limit
+        2. Aguarda rate limit
+        3. Aguarda delay aleatório (só se configurado)
+        4. Executa com retry automático e cacheia o resultado
+        
+        Args:
+            func: Função para executar
+            cache: APICache (opcional)
+            cache_key: Tupla (url, params) para o cache
+        """
+        # 1. Cache
+        hit = self._cached(cache, cache_key)
+        if hit is not None:
+            return hit
+        
+        # 2. Rate limit
+        if self._limited:
+            self.rate_limiter.wait_if_needed()
+        
+        # 3. Delay aleatório
+        if self._delayed:
+            self.delayer.sleep()
+        
+        # 4. Execute com retry
+        data = self.retry.execute_with_retry(self._timed(func), *args, **kwargs)
+        if cache is not None and cache_key is not None:
+            cache.set(*cache_key, data)
+        return data
+    
+    async def aexecute(
+        self,
+        func: Callable,
+        *args,
+        cache: Any = None,
+        cache_key: Optional[Tuple] = None,
+        **kwargs
+    ):
         """
-        # 1. Rate limit
-        self.rate_limiter.wait_if_needed()
+        Versão assíncrona de execute para corrotinas
+        
+        O balde de rate limit é compartilhado com execute(); a espera usa
+        asyncio.sleep, sem bloquear o event loop.
+        """
+        # 1. Cache
+        hit = self._cached(cache, cache_key)
+        if hit is not None:
+            return hit
+        
+        # 2. Rate limit
+        if self._limited:
+            await self.rate_limiter.async_wait_if_needed()
         
-        # 2. Delay aleatório
-        self.delayer.sleep()
+        # 3. Delay aleatório
+        if self._delayed:
+            await asyncio.sleep(self.delayer.get_delay())
         
-        # 3. Execute com retry
-        return self.retry.execute_with_retry(func, *args, **kwargs)
+        # 4. Execute com retry
+        data = await self.retry.aexecute_with_retry(self._atimed(func), *args, **kwargs)
+        if cache is not None and cache_key is not None:
+            cache.set(*cache_key, data)
+        return data
     
     def get_stats(self) -> dict:
         """Retorna estatísticas de uso"""
@@ -231,6 +656,7 @@ class CombinedRateLimiter:
             'name': self.name,
             'current_rate_per_min': self.rate_limiter.get_current_rate(),
             'max_rate_per_min': self.rate_limiter.max_requests,
+            'aimd_rate_per_min': self.aimd.c,
             'min_delay_seconds': self.delayer.min_delay,
             'max_delay_seconds': self.delayer.max_delay,
             'max_retries': self.retry.max_retries,
@@ -240,24 +666,18 @@ class CombinedRateLimiter:
 # Instâncias globais para cada fonte de dados
 BCB_LIMITER = CombinedRateLimiter(
     max_requests_per_minute=100,
-    min_delay_seconds=0.5,
-    max_delay_seconds=1.5,
     max_retries=3,
     name="BCB"
 )
 
 FRED_LIMITER = CombinedRateLimiter(
     max_requests_per_minute=100,
-    min_delay_seconds=0.5,
-    max_delay_seconds=1.5,
     max_retries=3,
     name="FRED"
 )
 
 ANBIMA_LIMITER = CombinedRateLimiter(
     max_requests_per_minute=50,
-    min_delay_seconds=1.0,
-    max_delay_seconds=2.0,
     max_retries=3,
     name="ANBIMA"
 )
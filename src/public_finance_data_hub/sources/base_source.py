@@ -8,6 +8,7 @@ Classe base para todas as fontes de dados com:
 - Retry automático
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, List, Any
@@ -15,7 +16,7 @@ from datetime import datetime
 
 from public_finance_data_hub.core.rate_limiter import CombinedRateLimiter
 from public_finance_data_hub.core.cache import APICache, get_or_cache
-from public_finance_data_hub.core.http_client import HTTPClient
+from public_finance_data_hub.core.http_client import AsyncHTTPClient, HTTPClient
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ class BaseSource(ABC):
         rate_limiter: CombinedRateLimiter,
         cache: Optional[APICache] = None,
         http_client: Optional[HTTPClient] = None,
+        max_in_flight: int = 8,
     ):
         """
         Args:
@@ -36,11 +38,13 @@ class BaseSource(ABC):
             rate_limiter: Limitador de taxa de requisições
             cache: Cache para requéstas (opcional)
             http_client: Cliente HTTP customizado (opcional)
+            max_in_flight: Requisições simultâneas máximas em fetch_json_batch
         """
         self.name = name
         self.rate_limiter = rate_limiter
         self.cache = cache
-        self.http_client = http_client or HTTPClient()
+        self.http_client = http_client or HTTPClient(rate_limiter=rate_limiter.rate_limiter)
+        self.max_in_flight = max_in_flight
         self.records_ingested = 0
         self.records_failed = 0
     
@@ -64,7 +68,7 @@ class BaseSource(ABC):
         """
         Busca dados com todas as proteções aplicadas
         
-        Aplica em ordem:
+        Aplica em ordem (dentro de CombinedRateLimiter.execute):
         1. Cache (se disponível e use_cache=True)
         2. Rate limiting
         3. Retry com backoff
@@ -79,25 +83,11 @@ class BaseSource(ABC):
         Returns:
             Dados retornados pela fetch_func
         """
-        
-        # 1. Tentar cache primeiro
-        if use_cache and self.cache:
-            cached = self.cache.get(url, params)
-            if cached is not None:
-                logger.debug(f"[{self.name}] Retornando do cache: {url}")
-                return cached
-        
-        # 2. Executar com rate limit + delay + retry
-        def wrapped_fetch():
-            return fetch_func()
-        
-        data = self.rate_limiter.execute(wrapped_fetch)
-        
-        # 3. Cachear resultado
-        if use_cache and self.cache:
-            self.cache.set(url, params, data)
-        
-        return data
+        return self.rate_limiter.execute(
+            fetch_func,
+            cache=self.cache if use_cache else None,
+            cache_key=(url, params),
+        )
     
     def fetch_json(
         self,
@@ -128,6 +118,49 @@ class BaseSource(ABC):
             use_cache=use_cache,
         )
     
+    async def fetch_json_batch(
+        self,
+        urls: List[str],
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        use_cache: bool = True,
+    ) -> List[Dict]:
+        """
+        Fetch JSON de várias URLs em paralelo, com as mesmas proteções
+        
+        As requisições compartilham um AsyncHTTPClient (HTTP/2, keep-alive)
+        e ficam limitadas a max_in_flight simultâneas; cada uma passa pelo
+        cache e pelo rate limiter como em fetch_json.
+        
+        Args:
+            urls: URLs para requisitar
+            params: Parâmetros GET (comuns a todas as URLs)
+            headers: Headers customizados
+            use_cache: Se deve cachear
+            
+        Returns:
+            Lista com o JSON de cada URL, na mesma ordem de `urls`
+        """
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+        
+        async with AsyncHTTPClient(
+            timeout=self.http_client.timeout,
+            rate_limiter=self.rate_limiter.rate_limiter,
+        ) as client:
+            
+            async def fetch_one(url: str) -> Dict:
+                async with semaphore:
+                    return await self.rate_limiter.aexecute(
+                        client.get_json,
+                        url,
+                        params=params,
+                        headers=headers,
+                        cache=self.cache if use_cache else None,
+                        cache_key=(url, params),
+                    )
+            
+            return await asyncio.gather(*(fetch_one(url) for url in urls))
+    
     def get_stats(self) -> Dict[str, Any]:
         """Retorna estatísticas da ingestão"""
         return {
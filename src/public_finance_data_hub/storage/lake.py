@@ -1,18 +1,87 @@
 """Data lake manager for partitioned Parquet storage with versioning."""
 
-import json
+import functools
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Sequence, Tuple
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
 import logging
 from dataclasses import dataclass, asdict
-from public_finance_data_hub.utils.hashing import calculate_file_sha256
+from public_finance_data_hub.utils.hashing import calculate_file_sha256, calculate_files_sha256
 from public_finance_data_hub.utils.dates import format_date
 from datetime import date
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Parquet write tuning for curated files
+ZSTD_LEVEL = 3
+ROW_GROUP_SIZE = 128_000
+DATA_PAGE_SIZE = 1 << 20
+
+# Dataset index kept at the lake root: {domain: {dataset: file_count}}
+INDEX_FILENAME = "_index.json"
+# Lock file serializing index updates across processes (e.g. parallel ingest)
+INDEX_LOCK_FILENAME = "_index.lock"
+# Index bookkeeping files (index, lock, temp files) all share this prefix
+INDEX_FILE_PREFIX = "_index."
+
+# Serializes index updates between threads (flock only covers processes)
+_index_thread_lock = threading.Lock()
+
+# Max buffers per writev call (POSIX guarantees at least 16)
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+
+def _writev_all(fd: int, buffers: Sequence[memoryview]) -> None:
+    """Write every buffer to fd with as few writev calls as possible.
+
+    Handles partial writes and the per-call IOV_MAX buffer limit.
+    """
+    pending = [b for b in buffers if len(b)]
+    while pending:
+        written = os.writev(fd, pending[:IOV_MAX])
+        while written and pending:
+            head = pending[0]
+            if written >= len(head):
+                written -= len(head)
+                pending.pop(0)
+            else:
+                pending[0] = head[written:]
+                written = 0
+
+
+def _scan_files(path: str) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries below path using os.scandir.
+
+    DirEntry caches the dirent type (and stat on some platforms), so this
+    avoids the extra stat per entry that Path.rglob + Path.stat incur.
+    """
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scan_files(entry.path)
+                else:
+                    yield entry
+    except FileNotFoundError:
+        return
+
 
 @dataclass
 class FileMetadata:
@@ -51,7 +120,7 @@ class DataLake:
         raw_dir: str = "raw",
         curated_dir: str = "curated",
         manifest_dir: str = "manifests",
-        compression: str = "snappy",
+        compression: str = "zstd",
     ):
         """Initialize data lake.
 
@@ -60,13 +129,14 @@ class DataLake:
             raw_dir: Raw data subdirectory
             curated_dir: Curated data subdirectory
             manifest_dir: Manifest subdirectory
-            compression: Parquet compression (snappy, gzip, brotli)
+            compression: Parquet compression (zstd, snappy, gzip, brotli)
         """
         self.base_dir = Path(base_dir)
         self.raw_dir = self.base_dir / raw_dir
         self.curated_dir = self.base_dir / curated_dir
         self.manifest_dir = self.base_dir / manifest_dir
         self.compression = compression
+        self.index_path = self.base_dir / INDEX_FILENAME
 
         # Create directories
         for d in [self.raw_dir, self.curated_dir, self.manifest_dir]:
@@ -98,6 +168,74 @@ class DataLake:
         logger.info(f"Saved raw: {save_path} ({len(content)} bytes)")
         return save_path
 
+    def save_raw_batch(
+        self,
+        source: str,
+        items: Sequence[Tuple[str, bytes]],
+        period_date: Optional[date] = None,
+        fsync: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Append many small raw payloads to one batch file.
+
+        Instead of one file (open/write/close plus a directory entry) per
+        payload, all items are appended to raw/<source>/<year>/<month>/
+        <YYYYMMDD>.batch with a single writev and at most one fsync. The
+        returned index locates each payload for read_raw_batch_item and can be
+        stored in the dataset manifest. Assumes one writer per batch file.
+
+        Args:
+            source: Data source name
+            items: (filename, content) pairs
+            period_date: Date for partitioning (default: today)
+            fsync: Flush the batch to disk before returning
+
+        Returns:
+            List of {"name", "path", "offset", "length"} dicts, one per item
+        """
+        if period_date is None:
+            period_date = date.today()
+
+        save_dir = self.raw_dir / source / str(period_date.year) / str(period_date.month)
+        save_dir.mkdir(parents=True, exist_ok=True)
+        batch_path = save_dir / f"{period_date.strftime('%Y%m%d')}.batch"
+
+        fd = os.open(batch_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            offset = os.fstat(fd).st_size
+            index = []
+            buffers = []
+            for name, content in items:
+                view = memoryview(content)
+                index.append(
+                    {"name": name, "path": str(batch_path), "offset": offset, "length": len(view)}
+                )
+                buffers.append(view)
+                offset += len(view)
+            _writev_all(fd, buffers)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        logger.info(f"Saved raw batch: {batch_path} ({len(index)} items)")
+        return index
+
+    @staticmethod
+    def read_raw_batch_item(entry: Dict[str, Any]) -> bytes:
+        """Read one payload written by save_raw_batch.
+
+        Args:
+            entry: Index entry returned by save_raw_batch
+
+        Returns:
+            Payload bytes
+        """
+        fd = os.open(entry["path"], os.O_RDONLY)
+        try:
+            return os.pread(fd, entry["length"], entry["offset"])
+        finally:
+            os.close(fd)
+
     def save_curated(
         self,
         domain: str,
@@ -134,14 +272,45 @@ class DataLake:
         # Add timestamp to filename
         timestamp = period_date.strftime("%Y%m%d")
         save_path = save_dir / f"{filename}_{timestamp}.parquet"
-
-        # Save Parquet
-        df.to_parquet(
-            save_path, engine="pyarrow", compression=self.compression, index=False
+        is_new_file = not save_path.exists()
+
+        # Save Parquet: dictionary-encoded, bounded row groups with min/max
+        # statistics so partition-pruned scans can skip row groups. Column
+        # types are not narrowed per file, so every partition of a dataset
+        # keeps the same schema
+        table = self._decode_dictionaries(pa.Table.from_pandas(df, preserve_index=False))
+        pq.write_table(
+            table,
+            save_path,
+            compression=self.compression,
+            compression_level=ZSTD_LEVEL if self.compression == "zstd" else None,
+            use_dictionary=True,
+            row_group_size=ROW_GROUP_SIZE,
+            data_page_size=DATA_PAGE_SIZE,
+            write_statistics=True,
         )
+        if is_new_file:
+            self._increment_index(domain, dataset)
         logger.info(f"Saved curated: {save_path} ({len(df)} rows)")
         return save_path
 
+    @staticmethod
+    def _decode_dictionaries(table: pa.Table) -> pa.Table:
+        """Cast dictionary (categorical) columns to their value type.
+
+        Partitions of a dataset must share one schema for dataset scans, but
+        the dictionary index width follows each file's cardinality. Plain
+        value types keep the schema stable; Parquet still dictionary-encodes
+        the column pages on write.
+        """
+        if not any(pa.types.is_dictionary(field.type) for field in table.schema):
+            return table
+        schema = pa.schema(
+            field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+            for field in table.schema
+        )
+        return table.cast(schema)
+
     def save_manifest(
         self,
         source: str,
@@ -187,19 +356,31 @@ class DataLake:
         manifest_dir.mkdir(parents=True, exist_ok=True)
 
         manifest_file = manifest_dir / f"{source}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        manifest_file.write_text(json.dumps(manifest_data, indent=2))
+        manifest_file.write_bytes(
+            orjson.dumps(manifest_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        )
         logger.info(f"Saved manifest: {manifest_file}")
         return manifest_file
 
     def load_curated(
-        self, domain: str, dataset: str, filters: Optional[Dict[str, Any]] = None
+        self,
+        domain: str,
+        dataset: str,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """Load curated Parquet dataset.
 
+        All partitions are read in a single multi-threaded Arrow scan. Filters
+        on the hive partition keys (``year``, ``month``) prune whole
+        directories, and ``columns`` is pushed down so only those column
+        chunks are decoded.
+
         Args:
             domain: Data domain
             dataset: Dataset name
-            filters: Pyarrow filters for partitions
+            filters: Equality filters, e.g. {"year": 2024, "month": 1}
+            columns: Columns to load (default: all file columns)
 
         Returns:
             Combined DataFrame from all partitions
@@ -210,15 +391,27 @@ class DataLake:
             logger.warning(f"Dataset not found: {dataset_dir}")
             return pd.DataFrame()
 
-        # Load all parquet files from partitions
-        parquet_files = list(dataset_dir.rglob("*.parquet"))
-        if not parquet_files:
+        lake_dataset = ds.dataset(str(dataset_dir), format="parquet", partitioning="hive")
+        if not lake_dataset.files:
             logger.warning(f"No parquet files found in {dataset_dir}")
             return pd.DataFrame()
 
-        logger.info(f"Loading {len(parquet_files)} files from {dataset}")
-        dfs = [pd.read_parquet(f) for f in parquet_files]
-        return pd.concat(dfs, ignore_index=True)
+        if columns is None:
+            # Keep the frame as written: drop partition keys that only live in
+            # the path, but not file columns that happen to share their name
+            file_columns = set(pq.read_schema(lake_dataset.files[0]).names)
+            partition_keys = set(lake_dataset.partitioning.schema.names) - file_columns
+            columns = [name for name in lake_dataset.schema.names if name not in partition_keys]
+
+        expr = None
+        if filters:
+            expr = functools.reduce(
+                lambda a, b: a & b, [ds.field(k) == v for k, v in filters.items()]
+            )
+
+        logger.info(f"Loading {len(lake_dataset.files)} files from {dataset}")
+        table = lake_dataset.to_table(columns=columns, filter=expr, use_threads=True)
+        return table.to_pandas(self_destruct=True)
 
     def get_file_metadata(self, file_path: Path) -> Dict[str, Any]:
         """Get metadata for a saved file.
@@ -229,49 +422,205 @@ class DataLake:
         Returns:
             Metadata dict
         """
+        return self._file_metadata(file_path, calculate_file_sha256(file_path))
+
+    def get_files_metadata(
+        self, file_paths: List[Path], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get metadata for several saved files, hashing them in parallel.
+
+        Args:
+            file_paths: Paths to files
+            max_workers: Hashing threads (default: ThreadPoolExecutor's default)
+
+        Returns:
+            Metadata dicts in the same order as file_paths
+        """
+        hashes = calculate_files_sha256(file_paths, max_workers=max_workers)
+        return [self._file_metadata(path, hashes[path]) for path in file_paths]
+
+    @staticmethod
+    def _file_metadata(file_path: Path, sha256: str) -> Dict[str, Any]:
+        """Build the manifest metadata dict for a file with a known hash."""
+        rows = columns = 0
         if file_path.suffix == ".parquet":
-            df = pd.read_parquet(file_path)
-            return {
-                "name": file_path.name,
-                "sha256": calculate_file_sha256(file_path),
-                "rows": len(df),
-                "columns": len(df.columns),
-                "size_bytes": file_path.stat().st_size,
-                "created_at": datetime.now().isoformat(),
-            }
-        else:
-            return {
-                "name": file_path.name,
-                "sha256": calculate_file_sha256(file_path),
-                "rows": 0,
-                "columns": 0,
-                "size_bytes": file_path.stat().st_size,
-                "created_at": datetime.now().isoformat(),
-            }
+            # Row and column counts come from the footer; no data is decoded
+            parquet_meta = pq.read_metadata(file_path)
+            rows = parquet_meta.num_rows
+            columns = parquet_meta.num_columns
+
+        return {
+            "name": file_path.name,
+            "sha256": sha256,
+            "rows": rows,
+            "columns": columns,
+            "size_bytes": file_path.stat().st_size,
+            "created_at": datetime.now().isoformat(),
+        }
 
-    def list_datasets(self, domain: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _read_index(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """Read the dataset index (None if missing or unreadable)."""
+        try:
+            return orjson.loads(self.index_path.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            return None
+
+    @contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """Hold the index lock across threads and processes."""
+        with _index_thread_lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.base_dir / INDEX_LOCK_FILENAME, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write_index(self, index: Dict[str, Dict[str, int]]) -> None:
+        """Atomically replace the dataset index file."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.base_dir, prefix=INDEX_FILENAME + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(index))
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _increment_index(self, domain: str, dataset: str) -> None:
+        """Count one new curated file for domain/dataset in the index.
+
+        Best effort: the curated file is already written, so an index error
+        only drops the index (rebuilt by the next list_datasets) and is logged.
+        """
+        try:
+            with self._index_lock():
+                index = self._read_index()
+                if index is None:
+                    # The rebuild already counts the file just written
+                    self._rebuild_index()
+                    return
+                datasets = index.setdefault(domain, {})
+                datasets[dataset] = datasets.get(dataset, 0) + 1
+                self._write_index(index)
+        except Exception as e:
+            logger.warning(f"Could not update dataset index: {e}")
+            try:
+                self.index_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def refresh_index(self) -> Dict[str, Dict[str, int]]:
+        """Rebuild the dataset index by scanning the curated tree.
+
+        Needed only when curated files are added or removed outside DataLake.
+
+        Returns:
+            The rebuilt {domain: {dataset: file_count}} index
+        """
+        with self._index_lock():
+            return self._rebuild_index()
+
+    def _rebuild_index(self) -> Dict[str, Dict[str, int]]:
+        """Scan the curated tree and write the index (index lock held)."""
+        index: Dict[str, Dict[str, int]] = {}
+        if self.curated_dir.is_dir():
+            with os.scandir(self.curated_dir) as it:
+                domain_entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+            for domain_entry in domain_entries:
+                with os.scandir(domain_entry.path) as it:
+                    dataset_entries = [e for e in it if e.is_dir(follow_symlinks=False)]
+                for dataset_entry in dataset_entries:
+                    file_count = sum(
+                        1 for e in _scan_files(dataset_entry.path) if e.name.endswith(".parquet")
+                    )
+                    if file_count:
+                        index.setdefault(domain_entry.name, {})[dataset_entry.name] = file_count
+
+        self._write_index(index)
+        return index
+
+    def list_datasets(
+        self,
+        domain: Optional[str] = None,
+        compute_hashes: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """List all datasets in lake.
 
+        Served from the dataset index maintained by save_curated; the curated
+        tree is only scanned when the index does not exist yet.
+
         Args:
             domain: Filter by domain (optional)
+            compute_hashes: Also return SHA256 of every parquet file, under
+                "file_hashes" ({path relative to the dataset dir: sha256});
+                all files across the listed datasets are hashed in parallel
+            max_workers: Hashing threads (default: ThreadPoolExecutor's default)
 
         Returns:
             List of dataset info dicts
         """
-        datasets = []
-        search_dir = self.curated_dir / domain if domain else self.curated_dir
-
-        for dataset_dir in search_dir.glob("*/*" if domain else "*/*"):
-            if dataset_dir.is_dir():
-                parquet_files = list(dataset_dir.rglob("*.parquet"))
-                if parquet_files:
-                    datasets.append(
-                        {
-                            "domain": dataset_dir.parent.name,
-                            "dataset": dataset_dir.name,
-                            "file_count": len(parquet_files),
-                            "path": str(dataset_dir),
-                        }
-                    )
+        index = self._read_index()
+        if index is None:
+            index = self.refresh_index()
+
+        domains = {domain: index.get(domain, {})} if domain else index
+        datasets = [
+            {
+                "domain": domain_name,
+                "dataset": dataset_name,
+                "file_count": file_count,
+                "path": str(self.curated_dir / domain_name / dataset_name),
+            }
+            for domain_name, dataset_counts in domains.items()
+            for dataset_name, file_count in dataset_counts.items()
+        ]
+
+        if compute_hashes:
+            # Walk every dataset first, then hash the whole batch at once
+            dataset_files = [
+                [
+                    Path(e.path)
+                    for e in _scan_files(info["path"])
+                    if e.name.endswith(".parquet")
+                ]
+                for info in datasets
+            ]
+            hashes = calculate_files_sha256(
+                [path for paths in dataset_files for path in paths], max_workers=max_workers
+            )
+            for info, paths in zip(datasets, dataset_files):
+                info["file_hashes"] = {
+                    path.relative_to(info["path"]).as_posix(): hashes[path] for path in paths
+                }
 
         return datasets
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get lake-wide statistics.
+
+        Returns:
+            Dict with dataset_count, file_count, total_size_bytes and total_size_gb
+        """
+        file_count = 0
+        total_size = 0
+        for entry in _scan_files(str(self.base_dir)):
+            # Dot-files (e.g. the Drive sync manifest) and the index files are
+            # bookkeeping, not dataset files
+            if entry.name.startswith((".", INDEX_FILE_PREFIX)):
+                continue
+            file_count += 1
+            total_size += entry.stat(follow_symlinks=False).st_size
+
+        return {
+            "dataset_count": len(self.list_datasets()),
+            "file_count": file_count,
+            "total_size_bytes": total_size,
+            "total_size_gb": total_size / 1024 / 1024 / 1024,
+        }
@@ -1,14 +1,24 @@
 """Date and time utilities."""
 
 from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Union, Tuple
-import pendulum
-from pendulum import DateTime
 
+ISO_DATE_FORMAT = "%Y-%m-%d"
 
-def parse_date(date_str: str, format_str: str = "%Y-%m-%d") -> date:
+# (start month, start day, end month, end day) for quarters 1-4
+_QUARTER_BOUNDS = ((1, 1, 3, 31), (4, 1, 6, 30), (7, 1, 9, 30), (10, 1, 12, 31))
+
+# Days to step back from a given weekday (Mon=0..Sun=6) to reach a business day
+_WEEKEND_BACKOFF = (0, 0, 0, 0, 0, 1, 2)
+
+
+def parse_date(date_str: str, format_str: str = ISO_DATE_FORMAT) -> date:
     """Parse date string to date object.
 
+    Zero-padded ISO dates (the default format) are parsed by
+    date.fromisoformat in C; anything else goes through strptime.
+
     Args:
         date_str: Date string
         format_str: Format string
@@ -16,10 +26,17 @@ def parse_date(date_str: str, format_str: str = "%Y-%m-%d") -> date:
     Returns:
         date object
     """
+    if (
+        format_str == ISO_DATE_FORMAT
+        and len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+    ):
+        return date.fromisoformat(date_str)
     return datetime.strptime(date_str, format_str).date()
 
 
-def format_date(d: Union[date, datetime], format_str: str = "%Y-%m-%d") -> str:
+def format_date(d: Union[date, datetime], format_str: str = ISO_DATE_FORMAT) -> str:
     """Format date to string.
 
     Args:
@@ -29,11 +46,15 @@ def format_date(d: Union[date, datetime], format_str: str = "%Y-%m-%d") -> str:
     Returns:
         Formatted date string
     """
+    if format_str == ISO_DATE_FORMAT:
+        # Skips strftime's format parsing and locale handling
+        return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
     if isinstance(d, datetime):
         d = d.date()
     return d.strftime(format_str)
 
 
+@lru_cache(maxsize=512)
 def get_quarter_end_dates(
     year: int, quarter: int
 ) -> Tuple[date, date]:
@@ -46,23 +67,13 @@ def get_quarter_end_dates(
     Returns:
         Tuple of (start_date, end_date)
     """
-    if quarter == 1:
-        start = date(year, 1, 1)
-        end = date(year, 3, 31)
-    elif quarter == 2:
-        start = date(year, 4, 1)
-        end = date(year, 6, 30)
-    elif quarter == 3:
-        start = date(year, 7, 1)
-        end = date(year, 9, 30)
-    elif quarter == 4:
-        start = date(year, 10, 1)
-        end = date(year, 12, 31)
-    else:
+    if not 1 <= quarter <= 4:
         raise ValueError(f"Invalid quarter: {quarter}")
-    return start, end
+    start_month, start_day, end_month, end_day = _QUARTER_BOUNDS[quarter - 1]
+    return date(year, start_month, start_day), date(year, end_month, end_day)
 
 
+@lru_cache(maxsize=256)
 def get_year_end_dates(year: int) -> Tuple[date, date]:
     """Get start and end dates for a year.
 
@@ -85,17 +96,25 @@ def business_day_offset(d: date, days: int) -> date:
     Returns:
         New date
     """
-    pend = pendulum.instance(d)
-    for _ in range(abs(days)):
-        if days > 0:
-            pend = pend.add(days=1)
-            while pend.weekday() in (5, 6):  # Sat, Sun
-                pend = pend.add(days=1)
-        else:
-            pend = pend.subtract(days=1)
-            while pend.weekday() in (5, 6):
-                pend = pend.subtract(days=1)
-    return pend.date()
+    # Closed form: whole weeks plus a remainder that may cross one weekend.
+    # A weekend start behaves like the adjacent weekday in the direction of
+    # travel (Sat/Sun + 1 and Fri + 1 are both Monday).
+    wd = d.weekday()
+    if days > 0:
+        if wd > 4:
+            d -= timedelta(days=wd - 4)
+            wd = 4
+        full, rem = divmod(days, 5)
+        extra = 2 if wd + rem > 4 else 0
+        return d + timedelta(days=full * 7 + rem + extra)
+    if days < 0:
+        if wd > 4:
+            d += timedelta(days=7 - wd)
+            wd = 0
+        full, rem = divmod(-days, 5)
+        extra = 2 if wd - rem < 0 else 0
+        return d - timedelta(days=full * 7 + rem + extra)
+    return d
 
 
 def is_business_day(d: date) -> bool:
@@ -119,17 +138,8 @@ def get_last_business_day_of_month(d: date) -> date:
     Returns:
         Last business day of that month
     """
-    # Get last day of month
-    if d.month == 12:
-        last_day = date(d.year + 1, 1, 1) - timedelta(days=1)
-    else:
-        last_day = date(d.year, d.month + 1, 1) - timedelta(days=1)
-
-    # Go back to previous business day if needed
-    while not is_business_day(last_day):
-        last_day -= timedelta(days=1)
-
-    return last_day
+    last_day = date(d.year + d.month // 12, d.month % 12 + 1, 1) - timedelta(days=1)
+    return last_day - timedelta(days=_WEEKEND_BACKOFF[last_day.weekday()])
 
 
 def get_today() -> date:
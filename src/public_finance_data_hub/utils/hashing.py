@@ -1,8 +1,14 @@
 """Hashing utilities for data deduplication and integrity verification."""
 
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional
+
+
+def _md5():
+    """MD5 for checksums only (allowed on FIPS-restricted builds)."""
+    return hashlib.md5(usedforsecurity=False)
 
 
 def calculate_sha256(content: bytes) -> str:
@@ -26,11 +32,31 @@ def calculate_file_sha256(file_path: Path) -> str:
     Returns:
         SHA256 hex digest
     """
-    sha256_hash = hashlib.sha256()
+    # file_digest runs the read/update loop in C with large buffers
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def calculate_files_sha256(
+    file_paths: Iterable[Path], max_workers: Optional[int] = None
+) -> Dict[Path, str]:
+    """Calculate SHA256 hashes of several files in parallel.
+
+    hashlib releases the GIL while hashing large buffers, so files hash
+    concurrently on separate cores up to disk bandwidth.
+
+    Args:
+        file_paths: Paths to files
+        max_workers: Worker threads (default: ThreadPoolExecutor's default)
+
+    Returns:
+        Dict mapping each path to its SHA256 hex digest
+    """
+    paths = list(file_paths)
+    if len(paths) <= 1:
+        return {path: calculate_file_sha256(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(calculate_file_sha256, paths)))
 
 
 def verify_sha256(file_path: Path, expected_hash: str) -> bool:
@@ -55,7 +81,7 @@ def calculate_md5(content: bytes) -> str:
     Returns:
         MD5 hex digest
     """
-    return hashlib.md5(content).hexdigest()
+    return hashlib.md5(content, usedforsecurity=False).hexdigest()
 
 
 def calculate_file_md5(file_path: Path) -> str:
@@ -67,8 +93,5 @@ def calculate_file_md5(file_path: Path) -> str:
     Returns:
         MD5 hex digest
     """
-    md5_hash = hashlib.md5()
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            md5_hash.update(byte_block)
-    return md5_hash.hexdigest()
+        return hashlib.file_digest(f, _md5).hexdigest()
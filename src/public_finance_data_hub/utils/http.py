@@ -1,22 +1,120 @@
 """HTTP client with automatic retry, backoff, and caching."""
 
+import asyncio
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple
+import atexit
 import hashlib
+import inspect
 import os
+import shutil
+import sqlite3
+import threading
 from pathlib import Path
 import json
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
 import logging
 
 logger = logging.getLogger(__name__)
 
+# SQLite file (inside cache_dir) holding cached response bodies and validators
+RESPONSE_CACHE_FILE = "responses.sqlite"
+
+# Keep-alive pool per host; the shared session serves every connector, so the
+# urllib3 default of 10 would drop and re-handshake connections under bursts
+POOL_SIZE = 32
+
+# Heuristic freshness (RFC 9111 4.2.2): an entry whose Last-Modified was long
+# before it was stored stays fresh for this fraction of that age, capped
+HEURISTIC_TTL_FRACTION = 0.1
+MAX_HEURISTIC_TTL = timedelta(days=7)
+
+# Random extra seconds added to each retry backoff (urllib3 >= 2 only)
+RETRY_BACKOFF_JITTER = 0.5
+RETRY_SUPPORTS_JITTER = "backoff_jitter" in inspect.signature(Retry).parameters
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a request is short-circuited by an open HostBreaker."""
+
+
+class HostBreaker:
+    """Circuit breaker shared by every client talking to the same host.
+
+    After ``failure_threshold`` server/connection failures within
+    ``window_seconds`` the breaker opens for ``cooldown_seconds``, and calls
+    fail immediately with CircuitOpenError instead of each endpoint running
+    its own retry/backoff chain against a host that is down.
+    """
+
+    failure_threshold = 5
+    window_seconds = 60.0
+    cooldown_seconds = 30.0
+
+    _breakers: Dict[str, "HostBreaker"] = {}
+    _breakers_lock = threading.Lock()
+
+    def __init__(self, host: str):
+        self.host = host
+        self.failures = 0
+        self.window_start = 0.0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_url(cls, url: str) -> "HostBreaker":
+        """Get the shared breaker for the host of ``url``."""
+        host = urlsplit(url).netloc
+        with cls._breakers_lock:
+            breaker = cls._breakers.get(host)
+            if breaker is None:
+                breaker = cls._breakers[host] = cls(host)
+            return breaker
+
+    def check(self) -> None:
+        """Raise CircuitOpenError if the breaker is open."""
+        if time.monotonic() < self.open_until:
+            raise CircuitOpenError(f"Circuit open for {self.host}, skipping request")
+
+    def record_success(self) -> None:
+        """Reset the failure count."""
+        with self._lock:
+            self.failures = 0
+
+    def record_failure(self, exc: BaseException) -> None:
+        """Count a failure; client errors (4xx) don't count."""
+        response = getattr(exc, "response", None)
+        if response is not None and response.status_code < 500:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            if now - self.window_start > self.window_seconds:
+                self.window_start = now
+                self.failures = 0
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.open_until = now + self.cooldown_seconds
+                self.failures = 0
+                logger.warning(
+                    f"Circuit opened for {self.host} for {self.cooldown_seconds:.0f}s"
+                )
+
 
 class CachedHTTPClient:
     """HTTP client with automatic retry, backoff, and local caching."""
 
+    _sessions: Dict[tuple, requests.Session] = {}
+    _sessions_lock = threading.Lock()
+    _cache_dbs: Dict[str, sqlite3.Connection] = {}
+    _cache_db_lock = threading.Lock()
+
     def __init__(
         self,
         cache_dir: Optional[str] = None,
@@ -42,51 +140,209 @@ class CachedHTTPClient:
 
         self.cache_ttl = timedelta(hours=cache_ttl_hours)
         self.timeout = timeout
+        self.max_retries = max_retries
         self.user_agent = user_agent or "PublicFinanceDataHub/1.0 (+https://github.com/marcosayo13/public-finance-data-hub)"
+        self._default_headers = {"User-Agent": self.user_agent}
+
+        self.session = self._get_shared_session(max_retries, backoff_factor)
+        self._cache_db = self._get_cache_db(self.cache_dir) if self.cache_dir else None
 
-        # Setup session with retry strategy
-        self.session = requests.Session()
+    @classmethod
+    def _get_shared_session(cls, max_retries: int, backoff_factor: float) -> requests.Session:
+        """Get the pooled session for this retry configuration.
+
+        Clients with the same configuration (e.g. every connector created with
+        default settings) share one session, so TCP/TLS connections are kept
+        alive and reused across connectors instead of one pool per instance.
+        """
+        key = (max_retries, backoff_factor)
+        with cls._sessions_lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                session = cls._create_session(max_retries, backoff_factor)
+                cls._sessions[key] = session
+            return session
+
+    @staticmethod
+    def _create_session(max_retries: int, backoff_factor: float) -> requests.Session:
+        """Create a session with retry strategy.
+
+        The session does no caching of its own: responses are cached (and
+        revalidated with ETag/Last-Modified) only in the responses table, which
+        the sync and async paths share.
+        """
+        session = requests.Session()
+        retry_kwargs: Dict[str, Any] = {}
+        if RETRY_SUPPORTS_JITTER:
+            retry_kwargs["backoff_jitter"] = RETRY_BACKOFF_JITTER
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=backoff_factor,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            **retry_kwargs,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @classmethod
+    def _get_cache_db(cls, cache_dir: Path) -> sqlite3.Connection:
+        """Get the shared response-cache connection for a cache dir.
+
+        One WAL-mode SQLite file replaces a JSON file per response: a hit is a
+        primary-key lookup instead of open + json.loads, and a 304 only
+        updates the stored timestamp.
+        """
+        key = str(cache_dir)
+        with cls._cache_db_lock:
+            conn = cls._cache_dbs.get(key)
+            if conn is None:
+                conn = sqlite3.connect(
+                    str(cache_dir / RESPONSE_CACHE_FILE),
+                    timeout=30,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS responses ("
+                    "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, content BLOB NOT NULL, "
+                    "etag TEXT, last_modified TEXT)"
+                )
+                cls._cache_dbs[key] = conn
+            return conn
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close every pooled session and cache DB (registered to run at exit)."""
+        with cls._sessions_lock:
+            for session in cls._sessions.values():
+                session.close()
+            cls._sessions.clear()
+        with cls._cache_db_lock:
+            for conn in cls._cache_dbs.values():
+                conn.close()
+            cls._cache_dbs.clear()
 
     def _get_cache_key(self, url: str, params: Optional[Dict] = None) -> str:
-        """Generate cache key from URL and parameters."""
+        """Generate cache key from URL and parameters.
+
+        The key only addresses the local cache, so a 128-bit BLAKE2b digest
+        is used instead of MD5 (faster in software, no integrity role).
+        """
         cache_str = f"{url}_{json.dumps(params or {}, sort_keys=True)}"
-        return hashlib.md5(cache_str.encode()).hexdigest()
+        return hashlib.blake2b(cache_str.encode(), digest_size=16).hexdigest()
 
-    def _load_from_cache(self, cache_key: str) -> Optional[str]:
-        """Load response from cache if valid."""
-        if not self.cache_dir:
+    def _read_cache_entry(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Read a cache entry (fresh or stale) with its validators."""
+        if self._cache_db is None:
             return None
 
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        if not cache_file.exists():
+        with self._cache_db_lock:
+            row = self._cache_db.execute(
+                "SELECT stored_at, content, etag, last_modified FROM responses WHERE key = ?",
+                (cache_key,),
+            ).fetchone()
+        if row is None:
             return None
+        return {"timestamp": row[0], "content": row[1], "etag": row[2], "last_modified": row[3]}
 
-        cache_data = json.loads(cache_file.read_text())
-        cache_time = datetime.fromisoformat(cache_data["timestamp"])
+    def _is_fresh(self, cache_data: Dict[str, Any]) -> bool:
+        """Whether a cache entry is still within its TTL.
 
-        if datetime.now() - cache_time > self.cache_ttl:
-            cache_file.unlink()
+        The TTL is cache_ttl, extended for slowly-changing resources to a
+        fraction of the time between their Last-Modified and when they were
+        stored (see HEURISTIC_TTL_FRACTION), so e.g. a table last modified
+        months ago is not revalidated every day.
+        """
+        age = time.time() - cache_data["timestamp"]
+        ttl = self.cache_ttl.total_seconds()
+        if age <= ttl:
+            return True
+        return age <= self._heuristic_ttl(cache_data)
+
+    @staticmethod
+    def _heuristic_ttl(cache_data: Dict[str, Any]) -> float:
+        """Heuristic freshness lifetime (seconds) from Last-Modified, or 0."""
+        last_modified = cache_data.get("last_modified")
+        if not last_modified:
+            return 0.0
+        try:
+            modified_at = parsedate_to_datetime(last_modified).timestamp()
+        except (TypeError, ValueError):
+            return 0.0
+        unchanged_for = cache_data["timestamp"] - modified_at
+        return min(unchanged_for * HEURISTIC_TTL_FRACTION, MAX_HEURISTIC_TTL.total_seconds())
+
+    def _load_from_cache(self, cache_key: str) -> Optional[bytes]:
+        """Load response from cache if valid."""
+        cache_data = self._read_cache_entry(cache_key)
+        if cache_data is None or not self._is_fresh(cache_data):
             return None
-
         return cache_data["content"]
 
-    def _save_to_cache(self, cache_key: str, content: str) -> None:
-        """Save response to cache."""
-        if not self.cache_dir:
+    def _save_to_cache(
+        self,
+        cache_key: str,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Save a raw response body to cache, with its ETag/Last-Modified validators."""
+        if self._cache_db is None:
             return
 
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        cache_data = {"timestamp": datetime.now().isoformat(), "content": content}
-        cache_file.write_text(json.dumps(cache_data))
+        with self._cache_db_lock:
+            self._cache_db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (cache_key, time.time(), content, etag, last_modified),
+            )
+
+    def _touch_cache_entry(self, cache_key: str) -> None:
+        """Restart the TTL of an entry the server confirmed unchanged (304)."""
+        if self._cache_db is None:
+            return
+
+        with self._cache_db_lock:
+            self._cache_db.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), cache_key)
+            )
+
+    def _merge_headers(self, *extra: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Default headers overlaid with caller/conditional headers.
+
+        The shared default dict is returned as-is when there is nothing to
+        add (requests does not mutate it), and caller dicts are never modified.
+        """
+        extra = [h for h in extra if h]
+        if not extra:
+            return self._default_headers
+        merged = dict(self._default_headers)
+        for h in extra:
+            merged.update(h)
+        return merged
+
+    @staticmethod
+    def _conditional_headers(cache_data: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a stale entry."""
+        if not cache_data:
+            return {}
+        headers = {}
+        if cache_data.get("etag"):
+            headers["If-None-Match"] = cache_data["etag"]
+        if cache_data.get("last_modified"):
+            headers["If-Modified-Since"] = cache_data["last_modified"]
+        return headers
 
     def get(
         self,
@@ -106,50 +362,207 @@ class CachedHTTPClient:
         Returns:
             Response object
         """
-        # Check cache
+        # Check cache; a stale entry is revalidated with a conditional GET
+        cache_data = None
         if use_cache:
             cache_key = self._get_cache_key(url, params)
-            cached_content = self._load_from_cache(cache_key)
-            if cached_content:
+            cache_data = self._read_cache_entry(cache_key)
+            if cache_data and self._is_fresh(cache_data):
                 logger.debug(f"Cache hit for {url}")
-                response = requests.Response()
-                response._content = cached_content.encode()
-                response.status_code = 200
-                return response
+                return self._cached_response(cache_data["content"])
 
         # Make request
-        headers = headers or {}
-        headers["User-Agent"] = self.user_agent
+        headers = self._merge_headers(headers, self._conditional_headers(cache_data))
 
         logger.debug(f"GET {url}")
-        response = self.session.get(
-            url, params=params, headers=headers, timeout=self.timeout
-        )
-        response.raise_for_status()
+        breaker = HostBreaker.for_url(url)
+        breaker.check()
+        try:
+            response = self.session.get(
+                url, params=params, headers=headers, timeout=self.timeout
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            breaker.record_failure(e)
+            raise
+        breaker.record_success()
+
+        if cache_data and response.status_code == 304:
+            logger.debug(f"Cache validated (304) for {url}")
+            self._touch_cache_entry(cache_key)
+            return self._cached_response(cache_data["content"])
 
         # Cache response
         if use_cache and response.status_code == 200:
+            self._save_to_cache(
+                cache_key,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+        return response
+
+    @staticmethod
+    def _cached_response(content: bytes) -> requests.Response:
+        """Wrap cached content in a 200 Response."""
+        response = requests.Response()
+        response._content = content
+        response.status_code = 200
+        return response
+
+    def async_client(self, max_connections: int = 10) -> httpx.AsyncClient:
+        """Create an HTTP/2 AsyncClient configured like this client.
+
+        Use as ``async with client.async_client() as ac:`` and pass ``ac`` to
+        aget(). The async client is bound to the running event loop, so it is
+        created per loop rather than shared like the sync session.
+        """
+        # With an explicit transport httpx ignores the client's limits/http2,
+        # so the pool is configured on the transport itself
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            headers=self._default_headers,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=max_connections),
+                retries=self.max_retries,
+            ),
+        )
+
+    async def aget(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        use_cache: bool = True,
+    ) -> httpx.Response:
+        """Async GET sharing the local cache with get().
+
+        Args:
+            client: AsyncClient from async_client()
+            url: Request URL
+            params: Query parameters
+            headers: Custom headers
+            use_cache: Use local cache
+
+        Returns:
+            Response object
+        """
+        cache_data = None
+        if use_cache:
             cache_key = self._get_cache_key(url, params)
-            self._save_to_cache(cache_key, response.text)
+            cache_data = self._read_cache_entry(cache_key)
+            if cache_data and self._is_fresh(cache_data):
+                logger.debug(f"Cache hit for {url}")
+                return httpx.Response(200, content=cache_data["content"])
+
+        conditional = self._conditional_headers(cache_data)
+        if conditional:
+            headers = {**(headers or {}), **conditional}
+
+        logger.debug(f"GET {url}")
+        breaker = HostBreaker.for_url(url)
+        breaker.check()
+        try:
+            response = await client.get(url, params=params, headers=headers)
+            # httpx raises for every non-2xx, including the 304 we asked for
+            if not (cache_data and response.status_code == 304):
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            breaker.record_failure(e)
+            raise
+        breaker.record_success()
+
+        if cache_data and response.status_code == 304:
+            logger.debug(f"Cache validated (304) for {url}")
+            self._touch_cache_entry(cache_key)
+            return httpx.Response(200, content=cache_data["content"])
+
+        if use_cache and response.status_code == 200:
+            self._save_to_cache(
+                cache_key,
+                response.content,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
 
         return response
 
+    async def aget_many(
+        self,
+        targets: Sequence[Tuple[str, Optional[Dict]]],
+        headers: Optional[Dict] = None,
+        use_cache: bool = True,
+        max_concurrency: int = 32,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Fetch several URLs concurrently, sharing the local cache with get().
+
+        Fresh cache hits are answered up front without opening a client; the
+        remaining requests are issued together over one HTTP/2 AsyncClient,
+        bounded by max_concurrency.
+
+        Args:
+            targets: (url, params) pairs
+            headers: Custom headers for every request
+            use_cache: Use local cache
+            max_concurrency: Max in-flight requests
+            return_exceptions: Return errors in place instead of raising the first
+
+        Returns:
+            Responses (or exceptions) in the same order as targets
+        """
+        results: List[Any] = [None] * len(targets)
+        pending = []
+        for i, (url, params) in enumerate(targets):
+            if use_cache:
+                cache_data = self._read_cache_entry(self._get_cache_key(url, params))
+                if cache_data and self._is_fresh(cache_data):
+                    logger.debug(f"Cache hit for {url}")
+                    results[i] = httpx.Response(200, content=cache_data["content"])
+                    continue
+            pending.append(i)
+
+        if not pending:
+            return results
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(client: httpx.AsyncClient, url: str, params: Optional[Dict]):
+            async with semaphore:
+                return await self.aget(client, url, params, headers, use_cache)
+
+        async with self.async_client(max_connections=max_concurrency) as client:
+            fetched = await asyncio.gather(
+                *(bounded(client, *targets[i]) for i in pending),
+                return_exceptions=return_exceptions,
+            )
+
+        for i, response in zip(pending, fetched):
+            results[i] = response
+        return results
+
     def download(
         self,
         url: str,
         save_path: str,
         params: Optional[Dict] = None,
         headers: Optional[Dict] = None,
-        chunk_size: int = 8192,
+        chunk_size: int = 1 << 20,
     ) -> Path:
         """Download file from URL.
 
+        The body is streamed from the socket to the file with
+        shutil.copyfileobj in large blocks, so no per-chunk Python loop runs.
+
         Args:
             url: File URL
             save_path: Local save path
             params: Query parameters
             headers: Custom headers
-            chunk_size: Download chunk size in bytes
+            chunk_size: Copy buffer size in bytes
 
         Returns:
             Path to downloaded file
@@ -157,24 +570,22 @@ class CachedHTTPClient:
         save_file = Path(save_path)
         save_file.parent.mkdir(parents=True, exist_ok=True)
 
-        headers = headers or {}
-        headers["User-Agent"] = self.user_agent
+        headers = self._merge_headers(headers)
 
         logger.info(f"Downloading {url} -> {save_path}")
 
-        response = self.session.get(
+        with self.session.get(
             url,
             params=params,
             headers=headers,
             timeout=self.timeout,
             stream=True,
-        )
-        response.raise_for_status()
-
-        with open(save_file, "wb") as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
+        ) as response:
+            response.raise_for_status()
+            # Let urllib3 undo gzip/deflate Content-Encoding while copying
+            response.raw.decode_content = True
+            with open(save_file, "wb") as f:
+                shutil.copyfileobj(response.raw, f, length=chunk_size)
 
         logger.info(f"Downloaded: {save_file.stat().st_size} bytes")
         return save_file
@@ -197,8 +608,7 @@ class CachedHTTPClient:
         Returns:
             Response object
         """
-        headers = headers or {}
-        headers["User-Agent"] = self.user_agent
+        headers = self._merge_headers(headers)
 
         logger.debug(f"POST {url}")
         response = self.session.post(
@@ -212,5 +622,11 @@ class CachedHTTPClient:
         return response
 
     def close(self) -> None:
-        """Close session."""
-        self.session.close()
+        """Release the client.
+
+        The underlying session is shared with other clients, so it stays open
+        and is closed at interpreter exit via close_all().
+        """
+
+
+atexit.register(CachedHTTPClient.close_all)
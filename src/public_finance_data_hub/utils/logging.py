@@ -1,21 +1,39 @@
 """Structured logging configuration for Public Finance Data Hub."""
 
+import atexit
 import logging
 import logging.handlers
-import json
+import queue
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 import os
 
+import orjson
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted UTC prefix) reused for records in that second
+        self._second = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Format record.created as an ISO-8601 UTC timestamp (microseconds)."""
+        sec = int(created)
+        cached_sec, prefix = self._second
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._second = (sec, prefix)
+        return f"{prefix}.{int((created - sec) * 1_000_000):06d}"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -25,7 +43,58 @@ class JSONFormatter(logging.Formatter):
         }
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_data)
+        return orjson.dumps(log_data).decode()
+
+
+class TextFormatter(logging.Formatter):
+    """Plain-text formatter that formats asctime at most once per second."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted local time) reused for records in that second
+        self._second = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format record.created, reusing the string for the same second."""
+        if not datefmt:
+            # The default format carries milliseconds, so it cannot be reused
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        cached_sec, formatted = self._second
+        if sec != cached_sec:
+            formatted = super().formatTime(record, datefmt)
+            self._second = (sec, formatted)
+        return formatted
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    The stock prepare() formats the record on the calling thread; here only
+    msg % args is merged, so formatting (JSON encoding, tracebacks) and file
+    I/O all run on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listeners draining each configured logger's queue, by logger name
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_listeners() -> None:
+    """Flush and stop all queue listeners (registered with atexit)."""
+    for listener in _listeners.values():
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    _listeners.clear()
+
+
+atexit.register(_stop_listeners)
 
 
 def setup_logging(
@@ -36,6 +105,11 @@ def setup_logging(
 ) -> logging.Logger:
     """Setup logger with file and console handlers.
 
+    The logger itself only gets a QueueHandler; the console and file handlers
+    are driven by a background QueueListener, so logging call sites never
+    block on formatting or file I/O. Call once per logger name at process
+    start; calling again replaces (and flushes) the previous listener.
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -50,6 +124,11 @@ def setup_logging(
 
     # Clear existing handlers
     logger.handlers = []
+    previous = _listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
+        for handler in previous.handlers:
+            handler.close()
 
     # Console handler
     console_handler = logging.StreamHandler()
@@ -58,13 +137,13 @@ def setup_logging(
     if format_type == "json":
         formatter = JSONFormatter()
     else:
-        formatter = logging.Formatter(
+        formatter = TextFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if log_dir provided)
     if log_dir:
@@ -77,7 +156,13 @@ def setup_logging(
         )
         file_handler.setLevel(getattr(logging, level.upper()))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(_LocalQueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
 
     return logger
 
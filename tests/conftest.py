@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 import tempfile
 import pandas as pd
+import pyarrow as pa
 from datetime import date
 
 
@@ -14,19 +15,28 @@ def temp_data_dir():
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def sample_dataframe():
-    """Create sample DataFrame for testing."""
-    return pd.DataFrame(
-        {
-            "date": pd.date_range("2024-01-01", periods=5, freq="D"),
-            "value": [1.0, 2.0, 3.0, 4.0, 5.0],
-            "ticker": ["A", "B", "C", "A", "B"],
-        }
+@pytest.fixture(scope="session")
+def _sample_table():
+    """Build the sample data once per session as an immutable Arrow table."""
+    return pa.Table.from_pandas(
+        pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=5, freq="D"),
+                "value": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "ticker": ["A", "B", "C", "A", "B"],
+            }
+        ),
+        preserve_index=False,
     )
 
 
 @pytest.fixture
+def sample_dataframe(_sample_table):
+    """Create sample DataFrame for testing (a fresh copy per test)."""
+    return _sample_table.to_pandas()
+
+
+@pytest.fixture(scope="session")
 def sample_csv_content():
     """Create sample CSV content as bytes."""
     content = (
@@ -1,7 +1,9 @@
 """Tests for data source connectors."""
 
 import pytest
+import numpy as np
 from datetime import date
+from public_finance_data_hub.connectors.bcb_sgs import _parse_br_dates
 from public_finance_data_hub.connectors import (
     BCBSGSConnector,
     B3Connector,
@@ -38,6 +40,12 @@ class TestBCBSGSConnector:
         assert "metadata" in result
         assert result["status"] in ["success", "error", "no_data"]
 
+    def test_parse_br_dates_with_unpadded_values(self):
+        """Batches with non zero-padded dates fall back instead of mangling them."""
+        parsed = _parse_br_dates(["01/02/2020", "1/2/2020", "15/12/2021"])
+        expected = np.array(["2020-02-01", "2020-02-01", "2021-12-15"], dtype="datetime64[ns]")
+        assert (parsed == expected).all()
+
 
 class TestB3Connector:
     """Test B3 connector."""
@@ -0,0 +1,52 @@
+"""Tests for date utilities."""
+
+import pytest
+from datetime import date, timedelta
+from public_finance_data_hub.utils.dates import (
+    business_day_offset,
+    get_last_business_day_of_month,
+)
+
+
+def _step_business_days(d: date, days: int) -> date:
+    """Reference implementation: step one day at a time, skipping weekends."""
+    step = timedelta(days=1 if days > 0 else -1)
+    for _ in range(abs(days)):
+        d += step
+        while d.weekday() >= 5:
+            d += step
+    return d
+
+
+class TestBusinessDayOffset:
+    """Test business_day_offset."""
+
+    @pytest.mark.parametrize("start", [date(2024, 1, 1) + timedelta(days=i) for i in range(7)])
+    def test_matches_day_by_day_stepping(self, start):
+        """Closed form agrees with stepping for every weekday and +-1..20 days."""
+        for days in range(-20, 21):
+            assert business_day_offset(start, days) == _step_business_days(start, days)
+
+    def test_zero_offset_returns_same_date(self):
+        """A zero offset leaves the date unchanged, even on a weekend."""
+        saturday = date(2024, 1, 6)
+        assert business_day_offset(saturday, 0) == saturday
+
+
+class TestLastBusinessDayOfMonth:
+    """Test get_last_business_day_of_month."""
+
+    @pytest.mark.parametrize("month", range(1, 13))
+    def test_is_last_weekday_of_month(self, month):
+        """Result is a weekday in the month with no later weekday in it."""
+        result = get_last_business_day_of_month(date(2024, month, 15))
+        assert result.month == month and result.weekday() < 5
+        following = result + timedelta(days=1)
+        while following.month == month:
+            assert following.weekday() >= 5
+            following += timedelta(days=1)
+
+    def test_month_ending_on_weekend(self):
+        """Months ending on Saturday/Sunday back off to Friday."""
+        assert get_last_business_day_of_month(date(2024, 8, 1)) == date(2024, 8, 30)
+        assert get_last_business_day_of_month(date(2024, 3, 1)) == date(2024, 3, 29)
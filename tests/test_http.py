@@ -0,0 +1,37 @@
+"""Tests for the cached HTTP client."""
+
+import asyncio
+
+import httpx
+
+from public_finance_data_hub.utils.http import CachedHTTPClient
+
+
+class TestCachedHTTPClientAsync:
+    """Test CachedHTTPClient async paths."""
+
+    def test_aget_revalidates_stale_entry_with_304(self, temp_data_dir):
+        """A 304 for a stale entry returns the cached body instead of raising."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"payload", headers={"ETag": '"v1"'})
+
+        client = CachedHTTPClient(cache_dir=str(temp_data_dir))
+        url = "https://example.test/series"
+
+        async def fetch_twice():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as ac:
+                first = await client.aget(ac, url)
+                # Make the entry stale so the next call revalidates
+                client._cache_db.execute("UPDATE responses SET stored_at = 0")
+                second = await client.aget(ac, url)
+            return first, second
+
+        first, second = asyncio.run(fetch_twice())
+        assert seen == [None, '"v1"']
+        assert first.content == second.content == b"payload"
+        assert second.status_code == 200
@@ -0,0 +1,65 @@
+"""Tests for rate limiting."""
+
+import asyncio
+import random
+
+from public_finance_data_hub.core.rate_limiter import AIMDController, ExponentialBackoffRetry
+
+
+class _Overloaded(Exception):
+    """Exception carrying a 503 response, like requests/httpx errors."""
+
+    class response:
+        status_code = 503
+
+
+class TestAIMDController:
+    """Test AIMDController."""
+
+    def test_healthy_latencies_hold_rate_near_max(self):
+        """Random but healthy latencies never throttle the rate."""
+        rng = random.Random(0)
+        aimd = AIMDController(c_max=100)
+        rates = [aimd.record(rng.lognormvariate(-1.5, 0.3)) for _ in range(5000)]
+        assert min(rates[100:]) >= 90
+        assert aimd.c == 100
+
+    def test_overload_decreases_at_most_once_per_window(self):
+        """A burst of overload errors halves the rate only once per window."""
+        aimd = AIMDController(c_max=100, window=50)
+        for _ in range(10):
+            aimd.record(0.1, _Overloaded())
+        assert aimd.c == 50
+
+        for _ in range(50):
+            aimd.record(0.1, _Overloaded())
+        assert aimd.c == 25
+
+    def test_client_errors_do_not_change_rate(self):
+        """Non-overload errors (e.g. parsing) leave the rate alone."""
+        aimd = AIMDController(c_max=100)
+        aimd.record(0.1, ValueError("bad payload"))
+        assert aimd.c == 100
+
+
+class TestExponentialBackoffRetry:
+    """Test ExponentialBackoffRetry."""
+
+    def test_cancelled_async_retry_does_not_leak_gate(self):
+        """A task cancelled while queued for the retry gate leaves it free."""
+        retry = ExponentialBackoffRetry(max_retries=3, name="test-cancel-gate")
+
+        async def failing():
+            raise ConnectionError("down")
+
+        async def scenario():
+            retry.gate.acquire()  # another call is already retrying
+            task = asyncio.create_task(retry.aexecute_with_retry(failing))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            retry.gate.release()
+
+        asyncio.run(scenario())
+        assert retry.gate.acquire(blocking=False)
+        retry.gate.release()
@@ -1,7 +1,9 @@
 """Tests for data lake storage."""
 
+import json
 import pytest
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 import pandas as pd
 from public_finance_data_hub.storage.lake import DataLake
 
@@ -77,6 +79,10 @@ class TestDataLake:
         assert manifest_file.exists()
         assert manifest_file.suffix == ".json"
 
+        manifest = json.loads(manifest_file.read_text())
+        assert manifest["file_count"] == 1
+        assert manifest["files"] == files_metadata
+
     def test_load_curated(self, temp_data_dir, sample_dataframe):
         """Test loading curated dataset."""
         lake = DataLake(base_dir=str(temp_data_dir))
@@ -94,6 +100,30 @@ class TestDataLake:
         assert len(df_loaded) > 0
         assert "date" in df_loaded.columns
 
+    def test_load_curated_partitions_with_different_value_ranges(self, temp_data_dir):
+        """Partitions whose values would fit different dtypes load together."""
+        lake = DataLake(base_dir=str(temp_data_dir))
+        small = pd.DataFrame({"volume": [1, 2], "ticker": pd.Categorical(["A", "A"])})
+        large = pd.DataFrame(
+            {"volume": [10**12, 2], "ticker": pd.Categorical([f"T{i}" for i in range(2)])}
+        )
+        lake.save_curated("market_data", "volumes", small, period_date=date(2024, 1, 1))
+        lake.save_curated("market_data", "volumes", large, period_date=date(2024, 2, 1))
+
+        df_loaded = lake.load_curated("market_data", "volumes")
+        assert sorted(df_loaded["volume"]) == [1, 2, 2, 10**12]
+        assert sorted(df_loaded["ticker"]) == ["A", "A", "T0", "T1"]
+
+    def test_load_curated_keeps_data_columns_named_like_partitions(self, temp_data_dir):
+        """A frame's own year column is not dropped as a partition key."""
+        lake = DataLake(base_dir=str(temp_data_dir))
+        df = pd.DataFrame({"year": [1999, 2000], "value": [1.0, 2.0]})
+        lake.save_curated("fundamentals", "annual", df, period_date=date(2024, 1, 1))
+
+        df_loaded = lake.load_curated("fundamentals", "annual")
+        assert "month" not in df_loaded.columns
+        assert sorted(df_loaded["year"]) == [1999, 2000]
+
     def test_list_datasets(self, temp_data_dir, sample_dataframe):
         """Test listing datasets in lake."""
         lake = DataLake(base_dir=str(temp_data_dir))
@@ -114,6 +144,33 @@ class TestDataLake:
         market_datasets = lake.list_datasets(domain="market_data")
         assert any(ds["dataset"] == "dataset1" for ds in market_datasets)
 
+    def test_concurrent_saves_keep_index_counts(self, temp_data_dir, sample_dataframe):
+        """Parallel save_curated calls do not lose dataset index updates."""
+        lake = DataLake(base_dir=str(temp_data_dir))
+        periods = [date(2024, 1, 1) + timedelta(days=i) for i in range(16)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda d: lake.save_curated("market_data", "daily", sample_dataframe, d),
+                    periods,
+                )
+            )
+
+        (info,) = lake.list_datasets(domain="market_data")
+        assert info["file_count"] == len(periods)
+
+    def test_list_datasets_with_hashes(self, temp_data_dir, sample_dataframe):
+        """Test listing datasets with per-file SHA256 hashes."""
+        lake = DataLake(base_dir=str(temp_data_dir))
+        file_path = lake.save_curated(
+            "market_data", "dataset1", sample_dataframe, period_date=date(2024, 1, 1)
+        )
+
+        (info,) = lake.list_datasets(domain="market_data", compute_hashes=True)
+        assert list(info["file_hashes"].values()) == [lake.get_file_metadata(file_path)["sha256"]]
+        assert "file_hashes" not in lake.list_datasets(domain="market_data")[0]
+
     def test_get_file_metadata(self, temp_data_dir, sample_dataframe):
         """Test getting file metadata."""
         lake = DataLake(base_dir=str(temp_data_dir))
@@ -129,3 +186,34 @@ class TestDataLake:
         assert metadata["size_bytes"] > 0
         assert "sha256" in metadata
         assert "created_at" in metadata
+
+    def test_get_files_metadata(self, temp_data_dir, sample_dataframe):
+        """Test batched metadata matches per-file metadata."""
+        lake = DataLake(base_dir=str(temp_data_dir))
+
+        paths = [
+            lake.save_curated("market_data", "test_dataset", sample_dataframe, period_date=d)
+            for d in (date(2024, 1, 1), date(2024, 2, 1))
+        ]
+
+        batched = lake.get_files_metadata(paths)
+        assert [m["name"] for m in batched] == [p.name for p in paths]
+        for meta, path in zip(batched, paths):
+            assert meta["sha256"] == lake.get_file_metadata(path)["sha256"]
+            assert meta["rows"] == len(sample_dataframe)
+
+    def test_get_stats(self, temp_data_dir, sample_dataframe):
+        """Test lake-wide statistics."""
+        lake = DataLake(base_dir=str(temp_data_dir))
+        lake.save_raw("test_source", "raw.txt", b"abc", period_date=date(2024, 1, 1))
+        lake.save_curated(
+            "market_data", "dataset1", sample_dataframe, period_date=date(2024, 1, 1)
+        )
+
+        stats = lake.get_stats()
+        assert stats["dataset_count"] == 1
+        assert stats["file_count"] == 2
+        assert stats["total_size_bytes"] > 3
+
+        (temp_data_dir / ".pfdh-sync-manifest.json").write_text("{}")
+        assert lake.get_stats()["file_count"] == 2